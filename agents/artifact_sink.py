@@ -0,0 +1,88 @@
+# agents/artifact_sink.py
+from typing import Dict
+import hashlib
+import json
+import os
+import tempfile
+
+
+class ArtifactSink:
+    """
+    Writes generated artifacts into one output directory, touching only files
+    whose content changed.
+
+    A manifest records the sha256 of every file the sink wrote, so unchanged
+    artifacts are skipped without reading them back and artifacts dropped
+    from a later run are removed. Files the sink never wrote are left alone.
+    """
+    MANIFEST = '.manifest.json'
+
+    def __init__(self, out_dir: str):
+        self.out_dir = out_dir
+
+    def write(self, artifacts: Dict[str, str]) -> Dict[str, int]:
+        """Sync `artifacts` ({filename: code}) to disk; returns written/skipped/removed counts."""
+        os.makedirs(self.out_dir, exist_ok=True)
+        previous = self._load_manifest()
+        manifest, counts = {}, {'written': 0, 'skipped': 0, 'removed': 0}
+
+        for name, code in artifacts.items():
+            data = code.encode('utf-8')
+            digest = hashlib.sha256(data).hexdigest()
+            path = os.path.join(self.out_dir, name)
+            manifest[name] = digest
+            known = previous.get(name)
+            if known is None:
+                known = self._hash_file(path)
+            if known == digest and os.path.exists(path):
+                counts['skipped'] += 1
+            else:
+                self._atomic_write(path, data)
+                counts['written'] += 1
+
+        for name in previous.keys() - manifest.keys():
+            path = os.path.join(self.out_dir, name)
+            if os.path.exists(path):
+                os.remove(path)
+                counts['removed'] += 1
+
+        if manifest != previous:
+            self._atomic_write(self._manifest_path(), json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8'))
+        return counts
+
+    def _manifest_path(self) -> str:
+        return os.path.join(self.out_dir, self.MANIFEST)
+
+    def _load_manifest(self) -> Dict[str, str]:
+        try:
+            with open(self._manifest_path(), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _hash_file(path: str):
+        # only consulted for files that predate the manifest
+        try:
+            with open(path, 'rb') as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return None
+
+    @staticmethod
+    def _atomic_write(path: str, data: bytes) -> None:
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except OSError:
+            mode = 0o644
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.chmod(tmp, mode)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
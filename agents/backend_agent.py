@@ -1,29 +1,34 @@
 # agents/backend_agent.py
-from typing import List, Dict
-from jinja2 import Environment, FileSystemLoader
+from typing import List, Dict, Tuple
+from .registry import ArtifactType, TemplateRegistry
+from .rendering import get_renderer
 import os
 
 TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), '..', 'templates', 'flask')
 
+# earlier types win when a task matches several; plugins add theirs after these
+BACKEND_TEMPLATES = TemplateRegistry(
+    'backend',
+    # a default minimal app file
+    fallback=ArtifactType((), lambda t: f"{t.replace(' ', '_')}.py", 'app.template.py', lambda t: {'feature': t}),
+)
+BACKEND_TEMPLATES.add(('authentication',), 'auth_routes.py', 'auth_routes.template.py')
+BACKEND_TEMPLATES.add(('task*',), 'task_routes.py', 'task_routes.template.py')
+BACKEND_TEMPLATES.add(('database*',), 'models.py', 'models.template.py')
+
 class BackendAgent:
-    def __init__(self, templates_dir: str = TEMPLATES_DIR):
-        self.env = Environment(loader=FileSystemLoader(templates_dir), trim_blocks=True, lstrip_blocks=True)
+    def __init__(self, templates_dir: str = TEMPLATES_DIR, templates: TemplateRegistry = BACKEND_TEMPLATES):
+        # shared across agent instances; renders are cached by (template, context)
+        self.renderer = get_renderer(templates_dir)
+        self.templates = templates
 
     def generate_backend(self, backend_tasks: List[str]) -> Dict[str, str]:
-        out = {}
-        for t in backend_tasks:
-            key = t.lower()
-            if 'authentication' in key:
-                out['auth_routes.py'] = self._render('auth_routes.template.py', {})
-            elif 'task management' in key or 'task' in key:
-                out['task_routes.py'] = self._render('task_routes.template.py', {})
-            elif 'database' in key:
-                out['models.py'] = self._render('models.template.py', {})
-            else:
-                # a default minimal app file
-                out[f"{t.replace(' ', '_')}.py"] = self._render('app_template.py', {'feature': t})
-        return out
+        return {fn: self._render(*spec) for fn, spec in self.plan_backend(backend_tasks).items()}
+
+    def plan_backend(self, backend_tasks: List[str]) -> Dict[str, Tuple]:
+        """Map each output filename to the (template, context[, templates_dir]) that renders it."""
+        return dict(self.templates.plan(t) for t in backend_tasks)
 
-    def _render(self, template_name: str, context: dict) -> str:
-        tpl = self.env.get_template(template_name)
-        return tpl.render(**context)
\ No newline at end of file
+    def _render(self, template_name: str, context: dict, templates_dir: str = None) -> str:
+        renderer = get_renderer(templates_dir) if templates_dir else self.renderer
+        return renderer.render(template_name, context)
@@ -0,0 +1,37 @@
+# agents/classifier.py
+import re
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+class KeywordClassifier:
+    """
+    Compiles a table of keyword rules into hash indexes so a brief is
+    tokenized once and every rule is classified in the same pass.
+
+    Keywords match whole words only ("db" does not fire inside "feedback"),
+    a plural "s" is accepted, and a trailing "*" marks a stem that matches
+    any word starting with it ("auth*" -> "auth", "authentication", ...).
+    """
+
+    def __init__(self, keyword_sets):
+        self._words = {}
+        self._stems = {}
+        for index, keywords in enumerate(keyword_sets):
+            for keyword in keywords:
+                table = self._stems if keyword.endswith("*") else self._words
+                table.setdefault(keyword.rstrip("*").lower(), set()).add(index)
+        self._stem_lengths = sorted({len(stem) for stem in self._stems})
+
+    def match(self, text: str):
+        """Return the set of rule indexes with at least one keyword in `text`."""
+        hits = set()
+        for token in set(_TOKEN_RE.findall(text.lower())):
+            hits.update(self._words.get(token, ()))
+            if token.endswith("s"):
+                hits.update(self._words.get(token[:-1], ()))
+            for length in self._stem_lengths:
+                if length > len(token):
+                    break
+                hits.update(self._stems.get(token[:length], ()))
+        return hits
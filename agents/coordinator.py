@@ -1,50 +1,163 @@
 # agents/coordinator.py
-from typing import Tuple, List, Dict
+from typing import Tuple, List, Dict, Iterator, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from .frontend_agent import FrontendAgent
 from .backend_agent import BackendAgent
-import re
+from .classifier import KeywordClassifier
+from .instrumentation import timed, count
+import os
+import threading
+import time
+
+# keywords mapping - extendable: (keywords, frontend task, backend task)
+FEATURE_RULES = [
+    (('auth*', 'login', 'signup', 'regist*'), 'Login Page', 'User Authentication API'),
+    (('task*', 'todo'), 'Task Dashboard', 'Task Management API'),
+    (('share', 'shared', 'sharing', 'collaborat*'), 'Share Dialog', 'Task Sharing API'),
+    (('profile',), 'Profile Page', 'User Profile API'),
+]
+DATABASE_KEYWORDS = ('database*', 'persist*', 'store', 'stored', 'storage', 'sqlite', 'postgres*', 'mongo*', 'api')
+
+# outputs kept per distinct task set; briefs that analyze the same way share one entry
+OUTPUT_CACHE_SIZE = int(os.getenv('COORDINATOR_CACHE_SIZE', 128))
+
+# compiled once; the database rule sits after the feature rules
+_classifier = KeywordClassifier([keywords for keywords, _, _ in FEATURE_RULES] + [DATABASE_KEYWORDS])
 
 class CoordinatorAgent:
     """Coordinator that parses brief -> subtask list -> dispatches to agents."""
-    def __init__(self):
+    def __init__(self, max_workers: Optional[int] = None, cache_size: int = OUTPUT_CACHE_SIZE):
         self.frontend = FrontendAgent()
         self.backend = BackendAgent()
+        # > 1 renders artifacts of both agents concurrently on a thread pool
+        self.max_workers = max_workers
+        # wall time in seconds per agent for the last process_brief call
+        self.last_timings: Dict[str, float] = {}
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_counters = {'hits': 0, 'misses': 0}
 
     def process_brief(self, brief: str) -> Dict[str, Dict[str, str]]:
         """Main entry. Returns a dict: { 'frontend': {filename: code}, 'backend': {filename: code} }"""
+        start = time.perf_counter()
         frontend_tasks, backend_tasks = self._analyze_brief(brief)
 
-        frontend_output = self.frontend.generate_ui_components(frontend_tasks)
-        backend_output = self.backend.generate_backend(backend_tasks)
+        key = (tuple(frontend_tasks), tuple(backend_tasks))
+        cached = self._cache_get(key)
+        if cached is not None:
+            count('codegen.cache_hit')
+            self.last_timings = {'frontend': 0.0, 'backend': 0.0, 'review': 0.0, 'total': time.perf_counter() - start}
+            return cached
+
+        count('codegen.cache_miss')
+        output = self._generate(frontend_tasks, backend_tasks)
+        self._cache_put(key, output)
+        return {side: dict(files) for side, files in output.items()}
+
+    def cache_stats(self) -> Dict[str, int]:
+        with self._cache_lock:
+            return dict(self._cache_counters, entries=len(self._cache), max_entries=self.cache_size)
+
+    def _cache_get(self, key):
+        with self._cache_lock:
+            output = self._cache.get(key)
+            if output is None:
+                self._cache_counters['misses'] += 1
+                return None
+            self._cache.move_to_end(key)
+            self._cache_counters['hits'] += 1
+        return {side: dict(files) for side, files in output.items()}
+
+    def _cache_put(self, key, output):
+        if self.cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._cache[key] = output
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _generate(self, frontend_tasks: List[str], backend_tasks: List[str]) -> Dict[str, Dict[str, str]]:
+        if self.max_workers and self.max_workers > 1:
+            return self._dispatch_concurrent(frontend_tasks, backend_tasks)
+
+        start = time.perf_counter()
+        with timed('codegen.frontend'):
+            frontend_output = self.frontend.generate_ui_components(frontend_tasks)
+        frontend_done = time.perf_counter()
+        with timed('codegen.backend'):
+            backend_output = self.backend.generate_backend(backend_tasks)
+        backend_done = time.perf_counter()
 
         # Optionally run a lightweight review pass
         self._review_outputs(frontend_output, backend_output)
+        review_done = time.perf_counter()
 
+        self.last_timings = {
+            'frontend': frontend_done - start,
+            'backend': backend_done - frontend_done,
+            'review': review_done - backend_done,
+            'total': review_done - start,
+        }
         return {
             'frontend': frontend_output,
             'backend': backend_output
         }
 
-    def _analyze_brief(self, brief: str) -> Tuple[List[str], List[str]]:
-        b = brief.lower()
-        f_tasks, bk_tasks = [], []
+    def iter_artifacts(self, brief: str) -> Iterator[Tuple[str, str]]:
+        """Yield ('frontend/<file>' or 'backend/<file>', code) pairs, rendering each artifact only when it is requested."""
+        frontend_tasks, backend_tasks = self._analyze_brief(brief)
+        sides = (
+            ('frontend', self.frontend, self.frontend.plan_ui_components(frontend_tasks)),
+            ('backend', self.backend, self.backend.plan_backend(backend_tasks)),
+        )
+        for side, agent, plan in sides:
+            for fn, spec in plan.items():
+                code = agent._render(*spec)
+                self._review_outputs({fn: code}, {})
+                yield f'{side}/{fn}', code
 
-        # keywords mapping - extendable
-        if re.search(r"auth|authentication|login|signup|register", b):
-            bk_tasks.append('User Authentication API')
-            f_tasks.append('Login Page')
+    def _dispatch_concurrent(self, frontend_tasks: List[str], backend_tasks: List[str]) -> Dict[str, Dict[str, str]]:
+        """Fan out every artifact of both agents, rendering and reviewing each on the pool."""
+        plans = {
+            'frontend': (self.frontend, self.frontend.plan_ui_components(frontend_tasks)),
+            'backend': (self.backend, self.backend.plan_backend(backend_tasks)),
+        }
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {
+                side: {fn: pool.submit(self._render_and_review, agent, fn, spec) for fn, spec in plan.items()}
+                for side, (agent, plan) in plans.items()
+            }
+            # merge in plan order so output never depends on completion order
+            results = {side: {fn: f.result() for fn, f in fs.items()} for side, fs in futures.items()}
+
+        output, timings, review = {}, {}, 0.0
+        for side, artifacts in results.items():
+            output[side] = {fn: code for fn, (code, _, _) in artifacts.items()}
+            timings[side] = max((done for _, done, _ in artifacts.values()), default=start) - start
+            review += sum(r for _, _, r in artifacts.values())
+        timings['review'] = review
+        timings['total'] = time.perf_counter() - start
+        self.last_timings = timings
+        return output
 
-        if re.search(r"task|todo|task management|tasks", b):
-            bk_tasks.append('Task Management API')
-            f_tasks.append('Task Dashboard')
+    def _render_and_review(self, agent, filename: str, spec: Tuple[str, dict]) -> Tuple[str, float, float]:
+        code = agent._render(*spec)
+        rendered = time.perf_counter()
+        self._review_outputs({filename: code}, {})
+        return code, rendered, time.perf_counter() - rendered
 
-        if re.search(r"share|sharing|collaborat", b):
-            bk_tasks.append('Task Sharing API')
-            f_tasks.append('Share Dialog')
+    def _analyze_brief(self, brief: str) -> Tuple[List[str], List[str]]:
+        with timed('codegen.analyze'):
+            hits = _classifier.match(brief)
+        f_tasks, bk_tasks = [], []
 
-        if re.search(r"profile|user profile", b):
-            bk_tasks.append('User Profile API')
-            f_tasks.append('Profile Page')
+        for i, (_, frontend_task, backend_task) in enumerate(FEATURE_RULES):
+            if i in hits:
+                bk_tasks.append(backend_task)
+                f_tasks.append(frontend_task)
 
         # default/general
         if not f_tasks and not bk_tasks:
@@ -53,13 +166,14 @@ class CoordinatorAgent:
             f_tasks.append('Landing Page')
 
         # database implied
-        if re.search(r"database|persist|store|sqlite|postgres|mongo", b) or 'api' in b:
+        if len(FEATURE_RULES) in hits:
             bk_tasks.append('Database Schema')
 
         return f_tasks, bk_tasks
 
     def _review_outputs(self, fe: Dict[str, str], be: Dict[str, str]):
         # lightweight checks — ensure no empty artifacts
-        for name, code in {**fe, **be}.items():
-            if not code.strip():
-                raise ValueError(f"Empty artifact produced for {name}")
\ No newline at end of file
+        with timed('codegen.review'):
+            for name, code in {**fe, **be}.items():
+                if not code.strip():
+                    raise ValueError(f"Empty artifact produced for {name}")
\ No newline at end of file
@@ -1,26 +1,32 @@
-from typing import List, Dict
-from jinja2 import Environment, FileSystemLoader
+from typing import List, Dict, Tuple
+from .registry import ArtifactType, TemplateRegistry
+from .rendering import get_renderer
 import os
 
 TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), '..', 'templates', 'react')
 
+# earlier types win when a task matches several; plugins add theirs after these
+FRONTEND_TEMPLATES = TemplateRegistry(
+    'frontend',
+    fallback=ArtifactType((), lambda t: f"{t.replace(' ', '')}.jsx", 'GenericComponent.jsx.template',
+                          lambda t: {'component_name': t.replace(' ', '')}),
+)
+FRONTEND_TEMPLATES.add(('login',), 'Login.jsx', 'Login.jsx.template')
+FRONTEND_TEMPLATES.add(('dashboard',), 'Dashboard.jsx', 'Dashboard.jsx.template')
+
 class FrontendAgent:
-    def __init__(self, templates_dir: str = TEMPLATES_DIR):
-        self.env = Environment(loader=FileSystemLoader(templates_dir), trim_blocks=True, lstrip_blocks=True)
+    def __init__(self, templates_dir: str = TEMPLATES_DIR, templates: TemplateRegistry = FRONTEND_TEMPLATES):
+        # shared across agent instances; renders are cached by (template, context)
+        self.renderer = get_renderer(templates_dir)
+        self.templates = templates
 
     def generate_ui_components(self, ui_tasks: List[str]) -> Dict[str, str]:
-        out = {}
-        for t in ui_tasks:
-            key = t.lower()
-            if 'login' in key:
-                out['Login.jsx'] = self._render('Login.jsx.template', {})
-            elif 'dashboard' in key or 'task dashboard' in key:
-                out['Dashboard.jsx'] = self._render('Dashboard.jsx.template', {})
-            else:
-                filename = f"{t.replace(' ', '')}.jsx"
-                out[filename] = self._render('GenericComponent.jsx.template', {'component_name': t.replace(' ', '')})
-        return out
+        return {fn: self._render(*spec) for fn, spec in self.plan_ui_components(ui_tasks).items()}
+
+    def plan_ui_components(self, ui_tasks: List[str]) -> Dict[str, Tuple]:
+        """Map each output filename to the (template, context[, templates_dir]) that renders it."""
+        return dict(self.templates.plan(t) for t in ui_tasks)
 
-    def _render(self, template_name: str, context: dict) -> str:
-        tpl = self.env.get_template(template_name)
-        return tpl.render(**context)
\ No newline at end of file
+    def _render(self, template_name: str, context: dict, templates_dir: str = None) -> str:
+        renderer = get_renderer(templates_dir) if templates_dir else self.renderer
+        return renderer.render(template_name, context)
@@ -0,0 +1,37 @@
+# agents/instrumentation.py
+from contextlib import contextmanager
+import time
+
+# objects with observe(stage, seconds) and increment(name, amount) methods
+_observers = []
+
+
+def add_observer(observer):
+    """Start reporting stage timings and counters to `observer`."""
+    if observer not in _observers:
+        _observers.append(observer)
+
+
+def remove_observer(observer):
+    if observer in _observers:
+        _observers.remove(observer)
+
+
+@contextmanager
+def timed(stage: str):
+    """Time the enclosed block as `stage`; a no-op while nobody is observing."""
+    if not _observers:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        for observer in list(_observers):
+            observer.observe(stage, elapsed)
+
+
+def count(name: str, amount: int = 1):
+    for observer in list(_observers):
+        observer.increment(name, amount)
@@ -0,0 +1,91 @@
+# agents/registry.py
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+from .classifier import KeywordClassifier
+import importlib
+import os
+import threading
+
+# comma-separated modules with a register_templates(registry) function, imported on first dispatch
+PLUGINS = [name.strip() for name in os.getenv('CODEGEN_PLUGINS', '').split(',') if name.strip()]
+
+
+class ArtifactType:
+    """
+    One kind of generated file: the task keywords that select it (see
+    KeywordClassifier for the syntax), its template, and the output
+    filename and template context, fixed or computed from the task name.
+    `templates_dir` is for plugins that ship their own templates.
+    """
+
+    def __init__(self, keywords: Sequence[str], filename: Union[str, Callable[[str], str]], template: str,
+                 context: Union[dict, Callable[[str], dict], None] = None, templates_dir: Optional[str] = None):
+        self.keywords = tuple(keywords)
+        self.filename = filename
+        self.template = template
+        self.context = context or {}
+        self.templates_dir = templates_dir
+
+    def plan(self, task: str) -> Tuple[str, tuple]:
+        """(output filename, (template, context[, templates_dir])) for `task`."""
+        filename = self.filename(task) if callable(self.filename) else self.filename
+        context = self.context(task) if callable(self.context) else dict(self.context)
+        if self.templates_dir:
+            return filename, (self.template, context, self.templates_dir)
+        return filename, (self.template, context)
+
+
+class TemplateRegistry:
+    """
+    Artifact types of one agent, dispatched by keyword.
+
+    On first use the plugins are imported and every type's keywords are
+    compiled into one KeywordClassifier, so resolving a task is a few hash
+    lookups however many types are registered. Types registered earlier win
+    when several match; tasks that match none get the fallback.
+    """
+
+    def __init__(self, side: str, fallback: Optional[ArtifactType] = None, plugins: Optional[List[str]] = None):
+        self.side = side
+        self.fallback = fallback
+        self.plugins = PLUGINS if plugins is None else plugins
+        self._types: List[ArtifactType] = []
+        self._classifier = None
+        self._plugins_loaded = False
+        self._resolved: Dict[str, ArtifactType] = {}
+        self._lock = threading.RLock()
+
+    def register(self, artifact: ArtifactType) -> ArtifactType:
+        with self._lock:
+            self._types.append(artifact)
+            self._classifier = None
+            self._resolved = {}
+        return artifact
+
+    def add(self, keywords: Sequence[str], filename, template: str, context=None, templates_dir=None) -> ArtifactType:
+        return self.register(ArtifactType(keywords, filename, template, context, templates_dir))
+
+    def resolve(self, task: str) -> ArtifactType:
+        artifact = self._resolved.get(task)
+        if artifact is not None:
+            return artifact
+        with self._lock:
+            if self._classifier is None:
+                self._load()
+            hits = self._classifier.match(task)
+            artifact = self._types[min(hits)] if hits else self.fallback
+            if artifact is None:
+                raise LookupError(f"No {self.side} template for task {task!r}")
+            self._resolved[task] = artifact
+        return artifact
+
+    def plan(self, task: str) -> Tuple[str, tuple]:
+        return self.resolve(task).plan(task)
+
+    def _load(self):
+        if not self._plugins_loaded:
+            self._plugins_loaded = True
+            for name in self.plugins:
+                register = getattr(importlib.import_module(name), 'register_templates', None)
+                if register:
+                    register(self)
+        self._classifier = KeywordClassifier([artifact.keywords for artifact in self._types])
@@ -0,0 +1,79 @@
+# agents/rendering.py
+from functools import lru_cache
+from .instrumentation import timed
+from jinja2 import ChoiceLoader, Environment, FileSystemLoader, ModuleLoader
+import argparse
+import os
+
+TEMPLATES_ROOT = os.path.join(os.path.dirname(__file__), '..', 'templates')
+# precompiled templates, one sub-directory per templates dir (see build_bundle)
+BUNDLE_DIR = os.getenv('TEMPLATE_BUNDLE_DIR', os.path.join(TEMPLATES_ROOT, '.compiled'))
+RENDER_CACHE_SIZE = int(os.getenv('TEMPLATE_RENDER_CACHE_SIZE', 256))
+
+
+class TemplateRenderer:
+    """
+    Jinja2 environment for one templates directory plus an LRU cache of
+    rendered output keyed on (template, context).
+
+    Templates come from the precompiled bundle when one has been built and
+    fall back to the source files, which are never re-stat'ed once loaded.
+    Rebuild the bundle after editing templates.
+    """
+
+    def __init__(self, templates_dir: str, bundle_dir: str = None, cache_size: int = RENDER_CACHE_SIZE):
+        loaders = [FileSystemLoader(templates_dir)]
+        if bundle_dir and os.path.isdir(bundle_dir):
+            loaders.insert(0, ModuleLoader(bundle_dir))
+        self.env = _environment(ChoiceLoader(loaders))
+        self._render_cached = lru_cache(maxsize=cache_size)(self._render_items)
+
+    def render(self, template_name: str, context: dict) -> str:
+        key = tuple(sorted(context.items()))
+        with timed('codegen.render'):
+            try:
+                return self._render_cached(template_name, key)
+            except TypeError:
+                # unhashable context values cannot be cached
+                return self._render_items(template_name, key)
+
+    def cache_info(self):
+        return self._render_cached.cache_info()
+
+    def _render_items(self, template_name: str, items: tuple) -> str:
+        return self.env.get_template(template_name).render(**dict(items))
+
+
+def _environment(loader) -> Environment:
+    return Environment(loader=loader, trim_blocks=True, lstrip_blocks=True, auto_reload=False)
+
+
+@lru_cache(maxsize=None)
+def _shared_renderer(templates_dir: str) -> TemplateRenderer:
+    return TemplateRenderer(templates_dir, os.path.join(BUNDLE_DIR, os.path.basename(templates_dir)))
+
+
+def get_renderer(templates_dir: str) -> TemplateRenderer:
+    """The process-wide renderer for `templates_dir`, shared by every agent instance."""
+    return _shared_renderer(os.path.normpath(os.path.abspath(templates_dir)))
+
+
+def _is_template(name: str) -> bool:
+    # *.template and *.template.<ext> files; skips plain assets and __pycache__ beside .py templates
+    parts = name.split('/')
+    return '__pycache__' not in parts and (parts[-1].endswith('.template') or '.template.' in parts[-1])
+
+
+def build_bundle(templates_dir: str, target: str) -> None:
+    """Precompile every template in `templates_dir` into modules under `target`."""
+    env = _environment(FileSystemLoader(templates_dir))
+    env.compile_templates(target, zip=None, filter_func=_is_template, ignore_errors=False)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Precompile the agent templates for ModuleLoader.')
+    parser.add_argument('--out', default=BUNDLE_DIR)
+    args = parser.parse_args()
+    for name in ('flask', 'react'):
+        build_bundle(os.path.join(TEMPLATES_ROOT, name), os.path.join(args.out, name))
+        print(f"Compiled templates/{name} -> {os.path.join(args.out, name)}")
@@ -0,0 +1,55 @@
+# admission.py
+from functools import wraps
+import threading
+
+from flask import current_app, jsonify
+
+
+class AdmissionControl:
+    """
+    Caps how many requests of the expensive routes run at once per process.
+
+    A request beyond ADMISSION_LIMIT waits up to ADMISSION_WAIT seconds for
+    a slot and is then turned away with 429 and Retry-After, so a burst
+    fails fast instead of piling up behind the workers. Works with the
+    gthread and gevent workers alike (gevent patches the semaphore).
+    """
+
+    def __init__(self, metrics=None):
+        self._metrics = metrics
+
+    def init_app(self, app):
+        app.extensions["admission"] = threading.BoundedSemaphore(app.config["ADMISSION_LIMIT"])
+        app.extensions["stream_slots"] = threading.BoundedSemaphore(app.config["SSE_STREAM_LIMIT"])
+
+    def open_stream(self, response):
+        """
+        Hold one of SSE_STREAM_LIMIT slots until the streamed `response`
+        is closed; a 429 response instead when all are taken.
+        """
+        slots = current_app.extensions["stream_slots"]
+        if not slots.acquire(blocking=False):
+            return self.reject()
+        response.call_on_close(slots.release)
+        return response
+
+    def limit(self, view):
+        """Decorator for a view that must hold a slot while it runs."""
+        @wraps(view)
+        def limited(*args, **kwargs):
+            slots = current_app.extensions["admission"]
+            if not slots.acquire(timeout=current_app.config["ADMISSION_WAIT"]):
+                return self.reject()
+            try:
+                return view(*args, **kwargs)
+            finally:
+                slots.release()
+        return limited
+
+    def reject(self):
+        if self._metrics is not None:
+            self._metrics.increment("admission.rejected")
+        retry_after = current_app.config["ADMISSION_RETRY_AFTER"]
+        response = jsonify({"msg": "Server busy, retry later"})
+        response.headers["Retry-After"] = str(retry_after)
+        return response, 429
@@ -0,0 +1,121 @@
+# agents/brief_cache.py
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+class BriefCache:
+    """
+    Memo for generated task breakdowns: a bounded in-process LRU in front of
+    an optional SQLite file that every process on the host can share.
+
+    Entries older than `ttl` seconds count as misses in both tiers, and
+    every `evict_every` writes also delete them, so the file stays bounded
+    by what was written within one TTL. Values must be JSON-serializable;
+    callers get the stored object back and must not mutate it.
+    """
+
+    def __init__(self, max_entries=1024, path=None, ttl=24 * 3600, evict_every=256):
+        self.max_entries = max_entries
+        self.path = path
+        self.ttl = ttl
+        self.evict_every = evict_every
+        self._writes = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._counters = {"hits": 0, "disk_hits": 0, "misses": 0}
+        if path:
+            with self._connection() as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS brief_cache "
+                    "(key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL)"
+                )
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and now - entry[0] <= self.ttl:
+                self._memory.move_to_end(key)
+                self._counters["hits"] += 1
+                return entry[1]
+            self._memory.pop(key, None)
+
+        if self.path:
+            row = self._connection().execute(
+                "SELECT value, stored_at FROM brief_cache WHERE key = ? AND stored_at >= ?",
+                (key, now - self.ttl),
+            ).fetchone()
+            if row is not None:
+                value = json.loads(row[0])
+                self._remember(key, value, row[1])
+                with self._lock:
+                    self._counters["disk_hits"] += 1
+                return value
+
+        with self._lock:
+            self._counters["misses"] += 1
+        return None
+
+    def set(self, key, value):
+        now = time.time()
+        self._remember(key, value, now)
+        if self.path:
+            with self._connection() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO brief_cache (key, value, stored_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(value), now),
+                )
+        with self._lock:
+            self._writes += 1
+            evict = self._writes % self.evict_every == 0
+        if evict:
+            self.evict_expired()
+
+    def evict_expired(self):
+        """Drop expired entries from both tiers; returns how many disk rows were removed."""
+        cutoff = time.time() - self.ttl
+        with self._lock:
+            for key in [k for k, (stored_at, _) in self._memory.items() if stored_at < cutoff]:
+                del self._memory[key]
+        if not self.path:
+            return 0
+        with self._connection() as conn:
+            return conn.execute("DELETE FROM brief_cache WHERE stored_at < ?", (cutoff,)).rowcount
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+        if self.path:
+            with self._connection() as conn:
+                conn.execute("DELETE FROM brief_cache")
+
+    def stats(self):
+        with self._lock:
+            lookups = sum(self._counters.values())
+            hits = self._counters["hits"] + self._counters["disk_hits"]
+            return dict(
+                self._counters,
+                entries=len(self._memory),
+                max_entries=self.max_entries,
+                hit_ratio=round(hits / lookups, 4) if lookups else 0.0,
+                disk=bool(self.path),
+            )
+
+    def _remember(self, key, value, stored_at):
+        with self._lock:
+            self._memory[key] = (stored_at, value)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _connection(self):
+        # sqlite3 connections are not shared across threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5)
+            self._local.conn = conn
+        return conn
@@ -1,35 +1,66 @@
 # agents/coordinator_agent.py
-from .frontend_agent import process_frontend_tasks
-from .backend_agent import process_backend_tasks
+from .frontend_agent import FRONTEND_RULES
+from .backend_agent import BACKEND_RULES
 from .review_agent import evaluate_tasks
+from .brief_cache import BriefCache
+import codegen
+import os
 import re
 
-def clean_text(text):
-    """Normalize brief text for easier keyword matching."""
-    return re.sub(r'[^a-zA-Z0-9\s]', '', text.lower())
+# one keyword matcher and one set of instrumentation hooks for both agent stacks,
+# from the top-level agents package
+KeywordClassifier = codegen.load('classifier').KeywordClassifier
+_instrumentation = codegen.load('instrumentation')
+timed, count = _instrumentation.timed, _instrumentation.count
 
-def generate_tasks_from_brief(title: str, description: str):
-    """
-    Local AI Coordinator — No GPT key required.
-    Splits the given project brief into structured backend and frontend tasks.
-    """
+# Basic business logic: auto-include extra steps based on keywords
+WORKFLOW_RULES = [
+    (("auth*", "login"), "Design user authentication workflow (register/login/logout)."),
+    (("task*", "project*"), "Create task scheduling and status management workflow."),
+    (("data*",), "Set up data validation and persistence layer in the database."),
+]
 
-    text = clean_text(f"{title} {description}")
+# Every agent's rules compiled into one classifier, so a brief is scanned once.
+BRIEF_RULES = (
+    [("backend", keywords, task) for keywords, task in BACKEND_RULES]
+    + [("frontend", keywords, task) for keywords, task in FRONTEND_RULES]
+    + [("workflows", keywords, task) for keywords, task in WORKFLOW_RULES]
+)
+BRIEF_CLASSIFIER = KeywordClassifier(keywords for _, keywords, _ in BRIEF_RULES)
+
+# Near-identical briefs normalize to the same text, so their breakdown is computed once.
+# BRIEF_CACHE_PATH adds a SQLite tier shared by every process on the host.
+brief_cache = BriefCache(
+    max_entries=int(os.getenv('BRIEF_CACHE_SIZE', 1024)),
+    path=os.getenv('BRIEF_CACHE_PATH'),
+    ttl=float(os.getenv('BRIEF_CACHE_TTL', 24 * 3600)),
+)
 
-    backend_ideas = process_backend_tasks(text)
-    frontend_ideas = process_frontend_tasks(text)
+def clean_text(text):
+    """Normalize brief text for easier keyword matching."""
+    with timed("brief.clean"):
+        return re.sub(r'[^a-zA-Z0-9\s]', '', text.lower())
 
-    # Basic business logic: auto-include extra steps based on keywords
-    business_workflows = []
+def classify_brief(title: str, description: str):
+    """Coordinator stage: normalize the brief and match it against every agent's rules in one pass."""
+    text = clean_text(f"{title} {description}")
+    with timed("brief.classify"):
+        return BRIEF_CLASSIFIER.match(text)
 
-    if "auth" in text or "login" in text:
-        business_workflows.append("Design user authentication workflow (register/login/logout).")
+def assign_tasks(hits):
+    """Agent stage: turn the matched rules into backend, frontend and workflow tasks."""
+    with timed("brief.assign"):
+        return _assign_tasks(hits)
 
-    if "task" in text or "project" in text:
-        business_workflows.append("Create task scheduling and status management workflow.")
+def _assign_tasks(hits):
+    matched = {"backend": [], "frontend": [], "workflows": []}
+    for i, (agent, _, task) in enumerate(BRIEF_RULES):
+        if i in hits:
+            matched[agent].append(task)
 
-    if "data" in text or "database" in text:
-        business_workflows.append("Set up data validation and persistence layer in the database.")
+    backend_ideas = matched["backend"]
+    frontend_ideas = matched["frontend"]
+    business_workflows = matched["workflows"]
 
     if not backend_ideas and not frontend_ideas:
         # fallback if text too generic
@@ -47,18 +78,32 @@ def generate_tasks_from_brief(title: str, description: str):
         "frontend": frontend_ideas,
         "workflows": business_workflows
     }
-    
-    output = {
-        "backend": backend_ideas + business_workflows,
-        "frontend": frontend_ideas,
-        "workflows": business_workflows
-    }
-
-    # NEW: Pass through review agent
-    review = evaluate_tasks(output)
-    output["review"] = review
 
+def review_tasks(generated):
+    """Review stage: attach the review agent's scores and feedback to generated tasks."""
+    output = dict(generated)
+    with timed("brief.review"):
+        output["review"] = evaluate_tasks(generated)
     return output
+
+def generate_tasks_from_brief(title: str, description: str):
+    """
+    Local AI Coordinator — No GPT key required.
+    Splits the given project brief into structured backend and frontend tasks.
+    """
+    text = clean_text(f"{title} {description}")
+    tasks = brief_cache.get(text)
+    if tasks is None:
+        count("brief.cache_miss")
+        with timed("brief.classify"):
+            hits = BRIEF_CLASSIFIER.match(text)
+        tasks = assign_tasks(hits)
+        brief_cache.set(text, tasks)
+    else:
+        count("brief.cache_hit")
+    # fresh lists, so callers never mutate the cached breakdown
+    return {agent: list(items) for agent, items in tasks.items()}
+
 # Example usage:
 # tasks = generate_tasks_from_brief("Build a Task Manager", "Create a web app with user login and task scheduling.")
 # print(tasks)
\ No newline at end of file
@@ -1,17 +1,10 @@
 # agents/frontend_agent.py
-def process_frontend_tasks(text: str):
-    """Detects frontend tasks from the project brief."""
-    tasks = []
 
-    if "ui" in text or "interface" in text:
-        tasks.append("Design user interface components and layout.")
-    if "dashboard" in text or "panel" in text:
-        tasks.append("Build a responsive dashboard for managing tasks.")
-    if "form" in text or "input" in text:
-        tasks.append("Create input forms and connect to backend APIs.")
-    if "react" in text or "frontend" in text:
-        tasks.append("Set up React components and handle state management.")
-    if "auth" in text or "login" in text:
-        tasks.append("Build user authentication UI (login/register forms).")
-
-    return tasks
+# (keywords, task) - extendable; see KeywordClassifier for the keyword syntax
+FRONTEND_RULES = [
+    (("ui", "interface*"), "Design user interface components and layout."),
+    (("dashboard*", "panel*"), "Build a responsive dashboard for managing tasks."),
+    (("form", "input*"), "Create input forms and connect to backend APIs."),
+    (("react*", "frontend*"), "Set up React components and handle state management."),
+    (("auth*", "login"), "Build user authentication UI (login/register forms)."),
+]
@@ -1,4 +1,7 @@
 # agents/review_agent.py
+import numpy as np
+
+
 def evaluate_tasks(generated_tasks):
     """
     Review Agent:
@@ -56,3 +59,73 @@ def evaluate_tasks(generated_tasks):
         "feedback": feedback,
         "summary": f"Reviewed {len(backend_tasks)} backend, {len(frontend_tasks)} frontend tasks, and {len(workflows)} workflows."
     }
+
+
+def _ascii_word_counts(texts):
+    """Words per ASCII text without NULs, like len(text.split()) but counted over one byte buffer."""
+    buf = np.frombuffer("\0".join(texts).encode("ascii"), dtype=np.uint8)
+    # the bytes str.split() separates on (\t-\r, \x1c-\x1f, space) plus the NUL joining the texts
+    nul = buf == 0
+    space = (buf <= 32) & ((buf >= 28) | ((buf >= 9) & (buf <= 13)) | nul)
+    # a word starts at every non-space byte that follows a space (or the buffer start)
+    starts = ~space
+    starts[1:] &= space[:-1]
+    bounds = np.concatenate(([0], np.flatnonzero(nul), [len(buf)]))
+    return np.diff(np.searchsorted(np.flatnonzero(starts), bounds))
+
+
+def _word_counts(texts):
+    """
+    len(text.split()) per text. Plain ASCII texts are counted together in
+    one byte buffer; the rest, whose whitespace may be Unicode (e.g. a
+    no-break space), are split one by one.
+    """
+    counts = np.fromiter((len(t.split()) if not t.isascii() or "\0" in t else -1 for t in texts),
+                         dtype=np.int64, count=len(texts))
+    ascii_only = np.flatnonzero(counts < 0)
+    if len(ascii_only):
+        counts[ascii_only] = _ascii_word_counts([texts[i] for i in ascii_only])
+    return counts
+
+
+def evaluate_many(task_sets):
+    """
+    Batch Review Agent:
+    Scores many generated-task dicts at once with the same rules as
+    evaluate_tasks, as NumPy operations over per-set token counts.
+
+    Returns columns (one array entry per task set): clarity, completeness,
+    balance and the backend/frontend/workflow task counts. Feedback text is
+    left to evaluate_tasks.
+    """
+    size = len(task_sets)
+    backend = [s.get("backend", []) for s in task_sets]
+    frontend = [s.get("frontend", []) for s in task_sets]
+    n_backend = np.fromiter(map(len, backend), dtype=np.int64, count=size)
+    n_frontend = np.fromiter(map(len, frontend), dtype=np.int64, count=size)
+    n_workflows = np.fromiter((len(s.get("workflows", [])) for s in task_sets), dtype=np.int64, count=size)
+    total = n_backend + n_frontend
+
+    # words per set: per-task counts summed over each set's slice of the flat task list
+    words = _word_counts([t for b, f in zip(backend, frontend) for t in b + f])
+    seen = np.concatenate(([0], np.cumsum(words)))
+    offsets = np.concatenate(([0], np.cumsum(total)))
+    word_totals = seen[offsets[1:]] - seen[offsets[:-1]]
+
+    has_tasks = total > 0
+    mean_words = np.divide(word_totals, total, out=np.zeros(size), where=has_tasks)
+    clarity = np.where(has_tasks, np.round(100 - np.minimum(40, mean_words), 2), 0)
+
+    both = (n_backend > 0) & (n_frontend > 0)
+    either = (n_backend > 0) | (n_frontend > 0)
+    completeness = np.select([both, either], [100, 70], default=40)
+    balance = np.where(both, np.maximum(60, 100 - np.abs(n_backend - n_frontend) * 10), 50)
+
+    return {
+        "clarity": clarity,
+        "completeness": completeness,
+        "balance": balance,
+        "backend_tasks": n_backend,
+        "frontend_tasks": n_frontend,
+        "workflows": n_workflows,
+    }
@@ -0,0 +1,67 @@
+# archive.py
+import io
+import tarfile
+import time
+import zipfile
+
+
+class _ChunkWriter:
+    """Write-only file object that hands out whatever was written since the last drain."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def stream_zip(artifacts):
+    """
+    Yield a zip archive of (name, text) artifacts chunk by chunk.
+
+    The writer is not seekable, so zipfile emits data descriptors and only
+    the central directory is held until the end; each artifact is sent as
+    soon as it has been compressed.
+    """
+    out = _ChunkWriter()
+    with zipfile.ZipFile(out, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+        for name, content in artifacts:
+            info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            zf.writestr(info, content)
+            chunk = out.drain()
+            if chunk:
+                yield chunk
+    yield out.drain()
+
+
+def stream_tar_gz(artifacts):
+    """Yield a gzip-compressed tar archive of (name, text) artifacts chunk by chunk."""
+    out = _ChunkWriter()
+    with tarfile.open(fileobj=out, mode='w|gz') as tar:
+        for name, content in artifacts:
+            data = content.encode('utf-8')
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = int(time.time())
+            tar.addfile(info, io.BytesIO(data))
+            chunk = out.drain()
+            if chunk:
+                yield chunk
+    yield out.drain()
+
+
+# format -> (stream function, mimetype, file extension)
+ARCHIVE_FORMATS = {
+    'zip': (stream_zip, 'application/zip', 'zip'),
+    'tar.gz': (stream_tar_gz, 'application/gzip', 'tar.gz'),
+}
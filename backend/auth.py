@@ -0,0 +1,60 @@
+# auth.py
+from collections import OrderedDict
+from functools import lru_cache
+import threading
+
+from flask import current_app
+from werkzeug.security import generate_password_hash
+
+from models import db, User
+
+
+class UserIdCache:
+    """
+    Per-process LRU of username -> user_id. Users are never renamed or
+    deleted, so entries never go stale; unknown usernames are not cached
+    because they may register later.
+    """
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._ids = OrderedDict()
+        self._lock = threading.Lock()
+
+    def resolve(self, username):
+        with self._lock:
+            user_id = self._ids.get(username)
+            if user_id is not None:
+                self._ids.move_to_end(username)
+                return user_id
+        user_id = db.session.query(User.user_id).filter_by(username=username).scalar()
+        if user_id is not None:
+            self.remember(username, user_id)
+        return user_id
+
+    def remember(self, username, user_id):
+        with self._lock:
+            self._ids[username] = user_id
+            self._ids.move_to_end(username)
+            while len(self._ids) > self.max_entries:
+                self._ids.popitem(last=False)
+
+
+def resolve_user_id(username):
+    """The user id for `username` through the app's cache; None for unknown users."""
+    return current_app.extensions["user_ids"].resolve(username)
+
+
+def hash_password(password):
+    return generate_password_hash(password, method=current_app.config["PASSWORD_HASH_METHOD"])
+
+
+def needs_rehash(password_hash):
+    """True when `password_hash` was made with another method or cost than the configured one."""
+    return password_hash.split("$", 1)[0] != _method_prefix(current_app.config["PASSWORD_HASH_METHOD"])
+
+
+@lru_cache(maxsize=None)
+def _method_prefix(method):
+    # werkzeug fills in default costs ("pbkdf2" -> "pbkdf2:sha256:<iterations>")
+    return generate_password_hash("", method=method).split("$", 1)[0]
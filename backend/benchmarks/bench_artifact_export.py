@@ -0,0 +1,79 @@
+# benchmarks/bench_artifact_export.py
+"""
+Peak memory of streaming an artifact archive versus building it in memory,
+for a brief that expands into many components.
+
+Zip streaming still keeps one small ZipInfo per entry for the central
+directory, so the gap grows with artifact size rather than count.
+
+Run from backend/:  python -m benchmarks.bench_artifact_export --components 2000 --component-kb 16
+"""
+import argparse
+import io
+import os
+import tarfile
+import time
+import tracemalloc
+import zipfile
+
+import codegen
+from archive import ARCHIVE_FORMATS
+
+
+def many_artifacts(count, size_kb=0):
+    """Render `count` distinct frontend components through the real agents, each padded to about `size_kb`."""
+    frontend = codegen.get_coordinator().frontend
+    for i in range(count):
+        filename, spec = next(iter(frontend.plan_ui_components([f"Widget {i}"]).items()))
+        # random padding stands in for a larger component and keeps every artifact unique
+        padding = os.urandom(size_kb * 512).hex()
+        yield f"frontend/{filename}", frontend._render(*spec) + f"\n// {padding}\n"
+
+
+def buffered(fmt, artifacts):
+    buf = io.BytesIO()
+    if fmt == 'zip':
+        with zipfile.ZipFile(buf, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+            for name, content in artifacts:
+                zf.writestr(name, content)
+    else:
+        with tarfile.open(fileobj=buf, mode='w:gz') as tar:
+            for name, content in artifacts:
+                data = content.encode('utf-8')
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+    return [buf.getvalue()]
+
+
+def measure(produce):
+    tracemalloc.start()
+    start = time.perf_counter()
+    size = sum(len(chunk) for chunk in produce())
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, peak, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--components', type=int, default=2000)
+    parser.add_argument('--component-kb', type=int, default=16)
+    args = parser.parse_args()
+
+    # warm up imports and the template cache so they don't count toward the first measurement
+    for fmt, (stream, _, _) in ARCHIVE_FORMATS.items():
+        list(stream(many_artifacts(1)))
+
+    for fmt, (stream, _, _) in ARCHIVE_FORMATS.items():
+        for label, produce in (
+            ('streamed', lambda: stream(many_artifacts(args.components, args.component_kb))),
+            ('buffered', lambda: buffered(fmt, many_artifacts(args.components, args.component_kb))),
+        ):
+            size, peak, elapsed = measure(produce)
+            print(f"{fmt:7} {label}: {size / 1024:9.1f} KiB archive, peak {peak / 1024:9.1f} KiB, {elapsed:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+# benchmarks/bench_auth.py
+"""
+Login throughput per password hash method, and GET /api/tasks/<username>
+throughput when the caller is identified by a bearer token, by a cached
+username lookup, and by an uncached one.
+
+Run from backend/:  python -m benchmarks.bench_auth --logins 20 --requests 500
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from models import db
+from server import create_app
+
+HASH_METHODS = ("scrypt", "pbkdf2:sha256:600000", "pbkdf2:sha256:100000")
+
+
+def make_app(workdir, name, **config):
+    app = create_app(dict(
+        config,
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{os.path.join(workdir, name)}.db",
+        JWT_SECRET_KEY="bench-secret-key-padded-to-32-bytes",
+    ))
+    with app.app_context():
+        db.create_all()
+    client = app.test_client()
+    assert client.post('/api/auth/register', json={"username": "bench", "password": "bench"}).status_code == 201
+    return client
+
+
+def rate(count, fn):
+    start = time.perf_counter()
+    for _ in range(count):
+        fn()
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--logins', type=int, default=20)
+    parser.add_argument('--requests', type=int, default=500)
+    args = parser.parse_args()
+
+    credentials = {"username": "bench", "password": "bench"}
+    with tempfile.TemporaryDirectory() as workdir:
+        print(f"{'hash method':24} {'logins/s':>10}")
+        for i, method in enumerate(HASH_METHODS):
+            client = make_app(workdir, f"login{i}", PASSWORD_HASH_METHOD=method)
+            logins = rate(args.logins, lambda: client.post('/api/auth/login', json=credentials))
+            print(f"{method:24} {logins:10.1f}")
+
+        print(f"\n{'caller identified by':24} {'requests/s':>10}")
+        cached = make_app(workdir, "cached")
+        uncached = make_app(workdir, "uncached", USER_ID_CACHE_SIZE=0)
+        token = cached.post('/api/auth/login', json=credentials).get_json()["access_token"]
+        cached.post('/api/briefs', json={"username": "bench", "title": "Bench", "description": "login dashboard api"})
+        uncached.post('/api/briefs', json={"username": "bench", "title": "Bench", "description": "login dashboard api"})
+        for label, client, headers in (
+            ("token", cached, {"Authorization": f"Bearer {token}"}),
+            ("username, cached", cached, {}),
+            ("username, uncached", uncached, {}),
+        ):
+            rps = rate(args.requests, lambda: client.get('/api/tasks/bench', headers=headers))
+            print(f"{label:24} {rps:10.1f}")
+
+
+if __name__ == '__main__':
+    main()
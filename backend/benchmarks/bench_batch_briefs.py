@@ -0,0 +1,63 @@
+# benchmarks/bench_batch_briefs.py
+"""
+Throughput of POST /api/briefs (one brief per request) against
+POST /api/briefs/batch, using the Flask test client and the configured DB.
+
+Run from backend/:  python -m benchmarks.bench_batch_briefs --briefs 500
+"""
+import argparse
+import time
+import uuid
+
+from werkzeug.security import generate_password_hash
+
+from models import db, User
+from server import create_app
+
+SAMPLE_BRIEFS = [
+    ("Task Manager", "Web app with user login, a task dashboard and a REST API backed by a database."),
+    ("Inventory", "Flask server with validation and a React frontend form for stock input."),
+    ("Blog", "Publishing platform with authentication and an admin panel."),
+]
+
+
+def make_briefs(username, count):
+    return [
+        {"username": username, "title": f"{title} #{i}", "description": description}
+        for i, (title, description) in zip(range(count), SAMPLE_BRIEFS * (count // len(SAMPLE_BRIEFS) + 1))
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--briefs', type=int, default=300)
+    parser.add_argument('--batch-size', type=int, default=100)
+    args = parser.parse_args()
+
+    app = create_app()
+    username = f"bench-{uuid.uuid4().hex[:8]}"
+    with app.app_context():
+        db.create_all()
+        db.session.add(User(username=username, password_hash=generate_password_hash('bench')))
+        db.session.commit()
+
+    client = app.test_client()
+    briefs = make_briefs(username, args.briefs)
+
+    start = time.perf_counter()
+    for brief in briefs:
+        assert client.post('/api/briefs', json=brief).status_code == 201
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(0, len(briefs), args.batch_size):
+        assert client.post('/api/briefs/batch', json=briefs[i:i + args.batch_size]).status_code == 201
+    batch = time.perf_counter() - start
+
+    print(f"single-brief: {args.briefs / single:8.1f} briefs/s ({single:.2f}s)")
+    print(f"batch x{args.batch_size}: {args.briefs / batch:8.1f} briefs/s ({batch:.2f}s)")
+    print(f"speedup:      {single / batch:8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+# benchmarks/bench_brief_index.py
+"""
+Near-duplicate lookup latency of the brief similarity index (BriefIndex)
+over a large synthetic corpus, for exact repeats, light rewordings and
+unrelated briefs, plus how many rewordings are found. A last run indexes
+one server-sized chunk (1000) of long briefs, where signing memory peaks.
+
+Run from backend/:  python -m benchmarks.bench_brief_index --briefs 100000
+"""
+import argparse
+import random
+import statistics
+import time
+import tracemalloc
+
+from similarity import BriefIndex
+
+WORDS = (
+    "build create design implement web mobile app platform service portal tool system user users team admin "
+    "task tasks project projects login signup auth dashboard panel report reports chart form forms input "
+    "search filter export import share sharing comment comments notification notifications profile settings "
+    "payment payments invoice billing order orders product catalog inventory stock booking calendar schedule "
+    "chat message messages upload file files image gallery review rating api rest database storage sync offline"
+).split()
+
+
+def make_brief(rng, words=(12, 40)):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(*words)))
+
+
+def reword(rng, brief):
+    """Drop or replace about one word in ten."""
+    words = brief.split()
+    for _ in range(max(1, len(words) // 10)):
+        i = rng.randrange(len(words))
+        if rng.random() < 0.5:
+            del words[i]
+        else:
+            words[i] = rng.choice(WORDS)
+    return " ".join(words)
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    return {p: samples[min(len(samples) - 1, int(len(samples) * p / 100))] * 1e6 for p in (50, 99)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--briefs', type=int, default=100000)
+    parser.add_argument('--users', type=int, default=1, help='spread the corpus over this many owners')
+    parser.add_argument('--queries', type=int, default=2000)
+    parser.add_argument('--threshold', type=float, default=0.8)
+    parser.add_argument('--num-perm', type=int, default=64)
+    parser.add_argument('--bands', type=int, default=8)
+    parser.add_argument('--long-words', type=int, default=300, help='words per brief in the long-brief run')
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    corpus = [make_brief(rng) for _ in range(args.briefs)]
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    index = BriefIndex(num_perm=args.num_perm, bands=args.bands)
+    for first in range(0, len(corpus), 1000):
+        index.add_many((brief_id, text, brief_id % args.users)
+                       for brief_id, text in enumerate(corpus[first:first + 1000], first + 1))
+    build = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"indexed {len(index)} briefs in {build:.1f}s ({len(index) / build:.0f}/s), {peak / 2**20:.0f} MiB")
+
+    picks = [rng.randrange(args.briefs) for _ in range(args.queries)]
+    workloads = {
+        "exact repeat": [(i + 1, corpus[i]) for i in picks],
+        "reworded": [(i + 1, reword(rng, corpus[i])) for i in picks],
+        "unrelated": [(None, make_brief(rng)) for _ in picks],
+    }
+    print(f"{'query':14} {'p50 us':>8} {'p99 us':>8} {'mean us':>8} {'found':>7}")
+    for label, queries in workloads.items():
+        latencies, found = [], 0
+        for brief_id, text in queries:
+            group = brief_id % args.users if brief_id else 0
+            t0 = time.perf_counter()
+            matches = index.query(text, group=group, threshold=args.threshold, limit=1)
+            latencies.append(time.perf_counter() - t0)
+            found += bool(matches) and (brief_id is None or matches[0][0] == brief_id)
+        p = percentiles(latencies)
+        print(f"{label:14} {p[50]:8.1f} {p[99]:8.1f} {statistics.fmean(latencies) * 1e6:8.1f} "
+              f"{found / len(queries):7.1%}")
+
+    long_briefs = [make_brief(rng, (args.long_words, args.long_words)) for _ in range(1000)]
+    tracemalloc.start()
+    start = time.perf_counter()
+    BriefIndex(num_perm=args.num_perm, bands=args.bands).add_many(
+        (brief_id, text, 0) for brief_id, text in enumerate(long_briefs, 1))
+    build = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"indexed 1000 briefs of {args.long_words} words in {build:.2f}s, {peak / 2**20:.0f} MiB")
+
+
+if __name__ == '__main__':
+    main()
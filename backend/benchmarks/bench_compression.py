@@ -0,0 +1,75 @@
+# benchmarks/bench_compression.py
+"""
+Bytes on the wire and serialization time for a large task list: the stock
+Flask JSON provider (pretty in debug mode, compact otherwise) against
+FastJSONProvider, each uncompressed and gzipped at a few levels.
+
+Run from backend/:  python -m benchmarks.bench_compression --tasks 500
+"""
+import argparse
+import gzip
+import random
+import time
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+import json_provider
+from json_provider import FastJSONProvider
+
+AGENTS = ("Backend", "Frontend")
+WORDS = "build design create implement user task api dashboard login form validation database layout".split()
+
+
+def task_page(count, seed=0):
+    rng = random.Random(seed)
+    return {
+        "tasks": [
+            {"id": count - i, "title": " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 40))).capitalize() + ".",
+             "agent": rng.choice(AGENTS), "status": "To Do", "priority": "Medium"}
+            for i in range(count)
+        ],
+        "next_cursor": None,
+    }
+
+
+def serialize(app, payload, repeat):
+    with app.app_context():
+        start = time.perf_counter()
+        for _ in range(repeat):
+            body = app.json.response(payload).get_data()
+        return body, (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--tasks', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    payload = task_page(args.tasks)
+    providers = []
+    for debug in (True, False):
+        app = Flask(__name__)
+        app.debug = debug
+        app.json = DefaultJSONProvider(app)
+        providers.append((f"default ({'debug' if debug else 'production'})", app))
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    providers.append((f"fast ({'orjson' if json_provider.orjson else 'stdlib'})", app))
+
+    print(f"{args.tasks} tasks")
+    print(f"{'provider':24} {'serialize ms':>12} {'identity KiB':>13} {'gzip-1 KiB':>11} {'gzip-6 KiB':>11} {'gzip-6 ms':>10}")
+    for label, app in providers:
+        body, seconds = serialize(app, payload, args.repeat)
+        sizes = {level: len(gzip.compress(body, compresslevel=level, mtime=0)) for level in (1, 6)}
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            gzip.compress(body, compresslevel=6, mtime=0)
+        gzip_ms = (time.perf_counter() - start) / args.repeat * 1000
+        print(f"{label:24} {seconds * 1000:12.2f} {len(body) / 1024:13.1f} {sizes[1] / 1024:11.1f} "
+              f"{sizes[6] / 1024:11.1f} {gzip_ms:10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+# benchmarks/bench_db_pool.py
+"""
+Request throughput of POST /api/briefs and GET /api/tasks/<username> under
+concurrent load, for several connection pool settings.
+
+Each setting runs in a fresh interpreter with its DB_POOL_* variables set,
+which create_app() reads when it builds the engine. A new process also
+keeps module-level state from one run (the brief task cache, metrics)
+out of the next. Uses DATABASE_URL when set, otherwise a temporary
+SQLite file.
+
+Run from backend/:  python -m benchmarks.bench_db_pool --threads 8 --requests 400
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+# (DB_POOL_SIZE, DB_MAX_OVERFLOW)
+POOL_SETTINGS = [(1, 0), (2, 2), (5, 10), (20, 20)]
+
+
+def run_worker(threads, requests):
+    from werkzeug.security import generate_password_hash
+    from models import db, User
+    from server import create_app
+
+    app = create_app()
+    username = f"bench-{uuid.uuid4().hex[:8]}"
+    with app.app_context():
+        db.create_all()
+        db.session.add(User(username=username, password_hash=generate_password_hash('bench')))
+        db.session.commit()
+
+    brief = {"username": username, "title": "Task Manager",
+             "description": "Web app with user login, a task dashboard and a REST API backed by a database."}
+
+    def create(_):
+        return app.test_client().post('/api/briefs', json=brief).status_code
+
+    def list_tasks(_):
+        return app.test_client().get(f'/api/tasks/{username}?limit=50').status_code
+
+    results = {}
+    for route, call in (('create_brief', create), ('get_tasks', list_tasks)):
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            statuses = list(pool.map(call, range(requests)))
+        elapsed = time.perf_counter() - start
+        results[route] = {"rps": requests / elapsed, "errors": sum(s >= 400 for s in statuses)}
+    print(json.dumps(results))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=400)
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.threads, args.requests)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        default_url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        print(f"{'pool':>10} {'create_brief req/s':>20} {'get_tasks req/s':>17} {'errors':>7}")
+        for size, overflow in POOL_SETTINGS:
+            env = dict(os.environ, DB_POOL_SIZE=str(size), DB_MAX_OVERFLOW=str(overflow))
+            env.setdefault('DATABASE_URL', default_url)
+            out = subprocess.run(
+                [sys.executable, '-m', 'benchmarks.bench_db_pool', '--worker',
+                 '--threads', str(args.threads), '--requests', str(args.requests)],
+                env=env, capture_output=True, text=True, check=True,
+            ).stdout
+            r = json.loads(out.strip().splitlines()[-1])
+            errors = r['create_brief']['errors'] + r['get_tasks']['errors']
+            print(f"{size:>4}+{overflow:<5} {r['create_brief']['rps']:>20.1f} {r['get_tasks']['rps']:>17.1f} {errors:>7}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,193 @@
+# benchmarks/bench_load.py
+"""
+Sustained concurrent load on POST /api/briefs (and optionally
+GET /api/tasks/<username>), reporting throughput, p50/p99 latency and how
+many requests were turned away with 429 by admission control.
+
+Starts its own server on a temporary SQLite database - gunicorn with
+gunicorn.conf.py, or werkzeug's threaded server - unless --url points at a
+running one.
+
+Run from backend/:  python -m benchmarks.bench_load --server werkzeug --concurrency 32 --duration 20
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from urllib.parse import urlsplit
+
+WORDS = ("login dashboard api task share profile database report form chart "
+         "team mobile export search upload calendar invoice admin").split()
+
+
+class Client:
+    """One keep-alive HTTP connection that reconnects after errors."""
+
+    def __init__(self, url):
+        parts = urlsplit(url)
+        self.host, self.port = parts.hostname, parts.port or 80
+        self.conn = None
+
+    def request(self, method, path, body=None):
+        if self.conn is None:
+            self.conn = http.client.HTTPConnection(self.host, self.port, timeout=60)
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        try:
+            self.conn.request(method, path, body=json.dumps(body) if body is not None else None, headers=headers)
+            response = self.conn.getresponse()
+            response.read()
+            if response.getheader("Connection", "").lower() == "close":
+                self.close()
+            return response.status
+        except (OSError, http.client.HTTPException):
+            self.close()
+            return 0
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+def run_load(url, username, concurrency, duration, read_ratio, seed):
+    """[(route, status, seconds)] of every request issued during `duration` seconds."""
+    samples = []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def worker(n):
+        rng = random.Random(seed + n)
+        client, local = Client(url), []
+        while time.perf_counter() < deadline:
+            if rng.random() < read_ratio:
+                route, method, path, body = "get_tasks", "GET", f"/api/tasks/{username}?limit=50", None
+            else:
+                description = " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 40)))
+                body = {"username": username, "title": f"Load {uuid.uuid4().hex[:8]}", "description": description}
+                route, method, path = "create_brief", "POST", "/api/briefs"
+            start = time.perf_counter()
+            status = client.request(method, path, body)
+            local.append((route, status, time.perf_counter() - start))
+        client.close()
+        with lock:
+            samples.extend(local)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return samples
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))] if values else float("nan")
+
+
+def report(samples, duration):
+    print(f"{'route':14} {'requests':>9} {'ok/s':>8} {'429':>6} {'errors':>7} {'p50 ms':>8} {'p99 ms':>8} "
+          f"{'429 p99 ms':>11}")
+    for route in sorted({s[0] for s in samples}):
+        rows = [s for s in samples if s[0] == route]
+        ok = [seconds for _, status, seconds in rows if 200 <= status < 300]
+        rejected = [seconds for _, status, seconds in rows if status == 429]
+        errors = len(rows) - len(ok) - len(rejected)
+        print(f"{route:14} {len(rows):9d} {len(ok) / duration:8.1f} {len(rejected):6d} {errors:7d} "
+              f"{percentile(ok, 0.5) * 1000:8.1f} {percentile(ok, 0.99) * 1000:8.1f} "
+              f"{percentile(rejected, 0.99) * 1000:11.1f}")
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_until_up(url, timeout=30):
+    parts = urlsplit(url)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection((parts.hostname, parts.port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"server at {url} did not start")
+
+
+def start_server(kind, port, env):
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if kind == "gunicorn":
+        if shutil.which("gunicorn") is None:
+            sys.exit("gunicorn is not installed (pip install gunicorn), use --server werkzeug")
+        command = ["gunicorn", "-c", "gunicorn.conf.py", "--bind", f"127.0.0.1:{port}"]
+    else:
+        command = [sys.executable, "-m", "benchmarks.bench_load", "--serve", str(port)]
+    return subprocess.Popen(command, cwd=backend_dir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def serve(port):
+    from werkzeug.serving import run_simple
+    from server import create_app
+
+    run_simple("127.0.0.1", port, create_app(), threaded=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', help='target a running server instead of starting one')
+    parser.add_argument('--server', choices=('gunicorn', 'werkzeug'), default='gunicorn')
+    parser.add_argument('--concurrency', type=int, default=32, help='concurrent client connections')
+    parser.add_argument('--duration', type=float, default=20, help='seconds of sustained load')
+    parser.add_argument('--read-ratio', type=float, default=0.0, help='fraction of requests that list tasks')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--serve', type=int, metavar='PORT', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve)
+        return
+
+    server, tmp = None, None
+    url = args.url
+    if url is None:
+        tmp = tempfile.mkdtemp()
+        env = dict(os.environ, DATABASE_URL=f"sqlite:///{os.path.join(tmp, 'load.db')}")
+        os.environ.update(env)
+        # schema first, so the server's workers do not race to create it
+        from models import db
+        from server import create_app
+        with create_app().app_context():
+            db.create_all()
+        port = free_port()
+        server = start_server(args.server, port, env)
+        url = f"http://127.0.0.1:{port}"
+    try:
+        wait_until_up(url)
+        username = f"load-{uuid.uuid4().hex[:8]}"
+        status = Client(url).request("POST", "/api/auth/register", {"username": username, "password": "load"})
+        if status != 201:
+            sys.exit(f"could not register a user (HTTP {status})")
+        print(f"{args.concurrency} connections for {args.duration:.0f}s against {url}")
+        samples = run_load(url, username, args.concurrency, args.duration, args.read_ratio, args.seed)
+        report(samples, args.duration)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+        if tmp is not None:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+# benchmarks/bench_search.py
+"""
+Latency of GET /api/search for growing account sizes, next to a LIKE scan
+of the same account. Searches read only the index entries of the query's
+words, so their latency follows the number of matches rather than the
+account size, while the scan reads every task of the account.
+
+Run from backend/:  python -m benchmarks.bench_search --sizes 1000 10000 100000
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import insert
+from werkzeug.security import generate_password_hash
+
+from models import db, User, ProjectBrief, TechnicalTask
+from server import create_app
+
+# 2000 distinct words with a skewed frequency, like real briefs
+WORDS = [f"{stem}{n}" for n in range(200) for stem in ("app", "form", "report", "stock", "audit",
+                                                       "chart", "cart", "email", "share", "upload")]
+WEIGHTS = [1 / (rank + 1) for rank in range(len(WORDS))]
+
+
+def phrase(rng, k):
+    return " ".join(rng.choices(WORDS, WEIGHTS, k=k))
+
+
+def seed(app, username, tasks, rng, per_brief=10):
+    with app.app_context():
+        user = User(username=username, password_hash=generate_password_hash("bench", method="pbkdf2:sha256:1"))
+        db.session.add(user)
+        db.session.flush()
+        brief_ids = db.session.execute(
+            insert(ProjectBrief).returning(ProjectBrief.brief_id, sort_by_parameter_order=True),
+            [{"user_id": user.user_id, "title": phrase(rng, 3), "description": phrase(rng, 12)}
+             for _ in range(tasks // per_brief)],
+        ).scalars().all()
+        db.session.execute(insert(TechnicalTask), [
+            {"brief_id": brief_id, "assigned_agent": "Backend", "description": phrase(rng, 6)}
+            for brief_id in brief_ids for _ in range(per_brief)
+        ])
+        db.session.commit()
+        return user.user_id
+
+
+def time_calls(fn, queries):
+    times = []
+    for q in queries:
+        start = time.perf_counter()
+        fn(q)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--queries', type=int, default=50)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(f"{'tasks':>8} {'search ms':>10} {'LIKE scan ms':>13}")
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{os.path.join(tmp, 'search.db')}"})
+        with app.app_context():
+            db.create_all()
+        client = app.test_client()
+        for i, size in enumerate(args.sizes):
+            username = f"bench{i}"
+            user_id = seed(app, username, size, rng)
+            queries = [phrase(rng, 2) for _ in range(args.queries)]
+
+            def indexed(q):
+                assert client.get(f'/api/search?username={username}&q={q}').status_code == 200
+
+            def scan(q):
+                a, b = q.split()  # substring matches, unranked
+                with app.app_context():
+                    (db.session.query(TechnicalTask.task_id)
+                     .join(ProjectBrief, ProjectBrief.brief_id == TechnicalTask.brief_id)
+                     .filter(ProjectBrief.user_id == user_id,
+                             TechnicalTask.description.like(f"%{a}%"),
+                             TechnicalTask.description.like(f"%{b}%"))
+                     .order_by(TechnicalTask.task_id.desc()).limit(20).all())
+
+            indexed(queries[0])  # warm-up
+            print(f"{size:>8} {time_calls(indexed, queries):10.2f} {time_calls(scan, queries):13.2f}")
+
+
+if __name__ == '__main__':
+    main()
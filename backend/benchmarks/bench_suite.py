@@ -0,0 +1,250 @@
+# benchmarks/bench_suite.py
+"""
+Reproducible benchmark suite for the agents and the API, compared against
+stored baselines.
+
+Every case is timed in a few fresh processes, over several rounds after
+one warm-up call each. The fastest round, the one least disturbed by other
+load on the machine, is compared with benchmarks/baseline.json and the run
+fails (exit 1) when a case is slower than its baseline by more than the
+threshold.
+Baselines are machine specific: refresh them with --save on the machine
+that runs the comparison.
+
+Run from backend/:  python -m benchmarks.bench_suite [--only coordinator] [--save]
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from werkzeug.security import generate_password_hash
+
+import codegen
+from agents import coordinator_agent
+from agents.brief_cache import BriefCache
+from models import db, User
+from server import create_app
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+DEFAULT_THRESHOLD = 0.25
+
+# keywords of both agent stacks mixed with filler, so briefs exercise every rule
+VOCABULARY = (
+    "login auth signup register task todo share collaborate profile database api storage "
+    "react dashboard form input ui interface panel validation flask server data project "
+    "the a with and for users team simple fast mobile web app page list view report"
+).split()
+
+CASES = {}
+
+
+def case(name, ops):
+    """Register a case: `setup(workdir)` returns the callable to time, which does `ops` operations per call."""
+    def register(setup):
+        CASES[name] = (setup, ops)
+        return setup
+    return register
+
+
+def synthetic_brief(rng, words):
+    return " ".join(rng.choice(VOCABULARY) for _ in range(words))
+
+
+def synthetic_corpus(count, seed=0):
+    rng = random.Random(seed)
+    return [(f"Project {i}", synthetic_brief(rng, rng.randint(8, 60))) for i in range(count)]
+
+
+# --- root agents: code generation ---
+def _process_brief_case(words):
+    def setup(workdir):
+        # no output cache, so every call classifies, renders and reviews
+        coordinator = codegen.load('coordinator').CoordinatorAgent(cache_size=0)
+        brief = synthetic_brief(random.Random(words), words)
+        return lambda: [coordinator.process_brief(brief) for _ in range(20)]
+    return setup
+
+
+for _label, _words in (("small", 12), ("medium", 250), ("large", 5000)):
+    case(f"coordinator.process_brief[{_label}]", ops=20)(_process_brief_case(_words))
+
+
+def _render_case(cache_size):
+    def setup(workdir):
+        rendering = codegen.load('rendering')
+        frontend, backend = codegen.load('frontend_agent'), codegen.load('backend_agent')
+        work = []
+        for module, agent, plan in (
+            (frontend, frontend.FrontendAgent(), lambda a: a.plan_ui_components(['Login Page', 'Task Dashboard', 'Share Dialog'])),
+            (backend, backend.BackendAgent(), lambda a: a.plan_backend(['User Authentication API', 'Database Schema'])),
+        ):
+            # a private renderer, so cache_size decides whether renders are memoized
+            renderer = rendering.TemplateRenderer(module.TEMPLATES_DIR, cache_size=cache_size)
+            work += [(renderer, spec) for spec in plan(agent).values()]
+
+        def run():
+            for i in range(200):
+                renderer, (template, context) = work[i % len(work)]
+                renderer.render(template, context)
+        return run
+    return setup
+
+
+case("rendering.render[uncached]", ops=200)(_render_case(0))
+case("rendering.render[cached]", ops=200)(_render_case(256))
+
+
+# --- backend agents: task generation ---
+def _generate_case(max_entries):
+    def setup(workdir):
+        corpus = synthetic_corpus(5000)
+        cache = BriefCache(max_entries=max_entries)
+
+        def run():
+            previous, coordinator_agent.brief_cache = coordinator_agent.brief_cache, cache
+            try:
+                for title, description in corpus:
+                    coordinator_agent.generate_tasks_from_brief(title, description)
+            finally:
+                coordinator_agent.brief_cache = previous
+        return run
+    return setup
+
+
+case("generate_tasks_from_brief[uncached]", ops=5000)(_generate_case(0))
+case("generate_tasks_from_brief[cached]", ops=5000)(_generate_case(10000))
+
+
+# --- API through the Flask test client on SQLite ---
+def _api_client(workdir, name):
+    app = create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{os.path.join(workdir, name)}.db"})
+    with app.app_context():
+        db.create_all()
+        # a cheap hash keeps registration out of the measurements
+        db.session.add(User(username="bench", password_hash=generate_password_hash("bench", method="pbkdf2:sha256:1")))
+        db.session.commit()
+    return app.test_client()
+
+
+@case("api.create_brief", ops=100)
+def api_create_brief(workdir):
+    client = _api_client(workdir, "create_brief")
+    corpus = synthetic_corpus(100, seed=1)
+
+    def run():
+        for title, description in corpus:
+            response = client.post('/api/briefs', json={"username": "bench", "title": title, "description": description})
+            assert response.status_code == 201
+    return run
+
+
+@case("api.list_tasks", ops=100)
+def api_list_tasks(workdir):
+    client = _api_client(workdir, "list_tasks")
+    briefs = [{"username": "bench", "title": t, "description": d} for t, d in synthetic_corpus(200, seed=2)]
+    assert client.post('/api/briefs/batch', json=briefs).status_code == 201
+
+    def run():
+        for _ in range(100):
+            assert client.get('/api/tasks/bench?limit=100').status_code == 200
+    return run
+
+
+# --- runner ---
+def run_worker(name, rounds):
+    """Time one case in this process and print its round times as JSON."""
+    setup, _ = CASES[name]
+    with tempfile.TemporaryDirectory() as workdir:
+        fn = setup(workdir)
+        fn()  # warm-up: imports, template compilation, connection setup
+        times = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+    print(json.dumps(times))
+
+
+def measure(name, rounds, processes):
+    # Each process lands in a different memory layout and CPU placement, which
+    # can shift a whole run by tens of percent, so rounds are pooled across processes.
+    times = []
+    for _ in range(processes):
+        out = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.bench_suite', '--worker', name, '--rounds', str(rounds)],
+            capture_output=True, text=True, check=True,
+        ).stdout
+        times += json.loads(out.strip().splitlines()[-1])
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.fmean(times),
+        "stddev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "rounds": len(times),
+    }
+
+
+def load_baseline(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)["cases"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--only', help='run only cases whose name contains this text')
+    parser.add_argument('--rounds', type=int, default=5, help='timed rounds per process')
+    parser.add_argument('--processes', type=int, default=3, help='fresh processes per case')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='allowed slowdown against the baseline, as a fraction (default 0.25)')
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--save', action='store_true', help='store this run as the new baseline')
+    parser.add_argument('--worker', metavar='CASE', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.rounds)
+        return
+
+    baseline = load_baseline(args.baseline)
+    results, regressions = {}, []
+    print(f"{'case':42} {'min':>10} {'ops/s':>12} {'baseline':>10} {'change':>8}")
+    for name, (_, ops) in CASES.items():
+        if args.only and args.only not in name:
+            continue
+        stats = measure(name, args.rounds, args.processes)
+        stats["ops_per_second"] = ops / stats["min"]
+        results[name] = stats
+
+        reference = baseline.get(name)
+        change = ""
+        if reference:
+            ratio = stats["min"] / reference["min"] - 1
+            change = f"{ratio:+.0%}"
+            if ratio > args.threshold:
+                regressions.append(name)
+                change += " !"
+        base = f"{reference['min'] * 1000:8.2f}ms" if reference else "-"
+        print(f"{name:42} {stats['min'] * 1000:8.2f}ms {stats['ops_per_second']:12.1f} {base:>10} {change:>8}")
+
+    if args.save:
+        # a partial run (--only) updates its cases and keeps the rest
+        merged = dict(load_baseline(args.baseline), **results)
+        with open(args.baseline, 'w') as f:
+            json.dump({"python": sys.version.split()[0], "cases": merged}, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Saved baseline for {len(results)} cases to {args.baseline}")
+    elif regressions:
+        print(f"Regressed by more than {args.threshold:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
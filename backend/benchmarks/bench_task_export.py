@@ -0,0 +1,72 @@
+# benchmarks/bench_task_export.py
+"""
+Peak Python memory of exporting every task of one account through the
+streamed /api/tasks/<username>/export, for growing account sizes. The
+peak should stay flat as the account grows.
+
+Run from backend/:  python -m benchmarks.bench_task_export --sizes 10000 50000 100000
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from sqlalchemy import insert
+from werkzeug.security import generate_password_hash
+
+from models import db, User, ProjectBrief, TechnicalTask
+from server import create_app
+
+
+def seed(app, username, tasks, per_brief=10):
+    with app.app_context():
+        user = User(username=username, password_hash=generate_password_hash("bench", method="pbkdf2:sha256:1"))
+        db.session.add(user)
+        db.session.flush()
+        brief_ids = db.session.execute(
+            insert(ProjectBrief).returning(ProjectBrief.brief_id, sort_by_parameter_order=True),
+            [{"user_id": user.user_id, "title": f"Brief {i}", "description": "generated"}
+             for i in range(tasks // per_brief)],
+        ).scalars().all()
+        db.session.execute(insert(TechnicalTask), [
+            {"brief_id": brief_id, "assigned_agent": "Backend", "description": f"Task {n} of brief {brief_id}"}
+            for brief_id in brief_ids for n in range(per_brief)
+        ])
+        db.session.commit()
+
+
+def measure(client, url):
+    tracemalloc.start()
+    start = time.perf_counter()
+    response = client.get(url, buffered=False)
+    size = sum(len(chunk) for chunk in response.response)
+    response.close()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, peak, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 50000])
+    args = parser.parse_args()
+
+    print(f"{'tasks':>8} {'format':>7} {'MiB out':>8} {'peak MiB':>9} {'seconds':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{os.path.join(tmp, 'export.db')}"})
+        with app.app_context():
+            db.create_all()
+        client = app.test_client()
+        for i, size in enumerate(args.sizes):
+            username = f"bench{i}"
+            seed(app, username, size)
+            measure(client, f'/api/tasks/{username}/export')  # warm-up
+            for fmt in ('ndjson', 'csv'):
+                out, peak, elapsed = measure(client, f'/api/tasks/{username}/export?format={fmt}')
+                print(f"{size:>8} {fmt:>7} {out / 2**20:8.1f} {peak / 2**20:9.2f} {elapsed:8.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,28 @@
+# codegen.py
+from functools import lru_cache
+import importlib
+import importlib.machinery
+import importlib.util
+import os
+import sys
+
+# The template code generators live in the top-level agents/ package. backend/
+# has its own `agents` package, so they are loaded under a separate name to
+# keep the two from shadowing each other.
+AGENTS_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'agents'))
+PACKAGE = 'codegen_agents'
+
+
+def load(module: str):
+    """Import `module` (e.g. 'coordinator') from the top-level agents package."""
+    if PACKAGE not in sys.modules:
+        spec = importlib.machinery.ModuleSpec(PACKAGE, None, is_package=True)
+        spec.submodule_search_locations = [AGENTS_DIR]
+        sys.modules[PACKAGE] = importlib.util.module_from_spec(spec)
+    return importlib.import_module(f'{PACKAGE}.{module}')
+
+
+@lru_cache(maxsize=None)
+def get_coordinator():
+    """Process-wide CoordinatorAgent used to render code for stored briefs."""
+    return load('coordinator').CoordinatorAgent()
@@ -0,0 +1,71 @@
+# compression.py
+import gzip
+import zlib
+
+from flask import current_app, request
+
+COMPRESSIBLE_MIMETYPES = {
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "text/csv",
+    "text/html",
+    "text/plain",
+}
+
+
+class Compression:
+    """
+    Compresses buffered responses with the stdlib when the client accepts
+    gzip or deflate and the body is at least COMPRESS_MIN_SIZE bytes.
+
+    Streamed responses (archives, exports, event streams) are passed through
+    untouched. Strong ETags become weak, since the compressed bytes differ
+    from the representation the tag was computed on; If-None-Match still
+    matches because werkzeug compares weakly.
+    """
+
+    def init_app(self, app):
+        app.after_request(self._compress)
+
+    def _compress(self, response):
+        if (
+            response.mimetype not in COMPRESSIBLE_MIMETYPES
+            or response.is_streamed
+            or response.direct_passthrough
+            or "Content-Encoding" in response.headers
+        ):
+            return response
+        response.vary.add("Accept-Encoding")
+        encoding = _negotiate(request.accept_encodings)
+        if encoding is None:
+            return response
+        if response.status_code == 304:
+            # same validator the client got with the compressed 200
+            _weaken_etag(response)
+            return response
+        if not 200 <= response.status_code < 300 or response.status_code == 204:
+            return response
+        data = response.get_data()
+        if len(data) < current_app.config["COMPRESS_MIN_SIZE"]:
+            return response
+
+        level = current_app.config["COMPRESS_LEVEL"]
+        # mtime=0 keeps the output identical for identical bodies
+        body = gzip.compress(data, compresslevel=level, mtime=0) if encoding == "gzip" else zlib.compress(data, level)
+        response.set_data(body)
+        response.headers["Content-Encoding"] = encoding
+        _weaken_etag(response)
+        return response
+
+
+def _weaken_etag(response):
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+
+
+def _negotiate(accept_encodings):
+    """'gzip' or 'deflate', whichever the client rates higher (gzip on ties); None for neither."""
+    best = max(("gzip", "deflate"), key=lambda encoding: accept_encodings[encoding])
+    return best if accept_encodings[best] > 0 else None
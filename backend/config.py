@@ -0,0 +1,66 @@
+# config.py
+import os
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+
+def _env_bool(name, default):
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def database_url():
+    """DATABASE_URL if set (e.g. sqlite:///local.db), else PostgreSQL from the DATABASE_* variables."""
+    url = os.getenv('DATABASE_URL')
+    if url:
+        return url
+    user = os.getenv('DATABASE_USERNAME')
+    password = os.getenv('DATABASE_PASSWORD')
+    name = os.getenv('DATABASE_NAME')
+    host = os.getenv('DATABASE_HOST', 'localhost')
+    port = os.getenv('DATABASE_PORT', '5432')
+    return f"postgresql://{user}:{password}@{host}:{port}/{name}"
+
+
+def is_sqlite(url):
+    return make_url(url).get_backend_name() == 'sqlite'
+
+
+def engine_options(url):
+    """
+    SQLALCHEMY_ENGINE_OPTIONS for `url` from the DB_POOL_* variables.
+
+    Unset variables keep SQLAlchemy's defaults. Size a pool so that
+    gunicorn workers x (DB_POOL_SIZE + DB_MAX_OVERFLOW) stays under the
+    server's connection limit.
+    """
+    options = {
+        "pool_pre_ping": _env_bool('DB_POOL_PRE_PING', False),
+        "pool_recycle": int(os.getenv('DB_POOL_RECYCLE', -1)),
+    }
+    if is_sqlite(url) and make_url(url).database in (None, '', ':memory:'):
+        # in-memory SQLite shares one connection; there is no pool to size
+        return options
+    for var, option in (('DB_POOL_SIZE', 'pool_size'),
+                        ('DB_MAX_OVERFLOW', 'max_overflow'),
+                        ('DB_POOL_TIMEOUT', 'pool_timeout')):
+        if os.getenv(var) is not None:
+            options[option] = int(os.getenv(var))
+    return options
+
+
+def enable_sqlite_wal(engine):
+    """
+    Put every SQLite connection of `engine` in WAL mode, so readers no longer
+    block on the writer, and wait on locks instead of failing immediately.
+    """
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, _):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
@@ -0,0 +1,64 @@
+# events.py
+import json
+import queue
+import threading
+
+
+class TaskEventBus:
+    """
+    Fans task create/update/delete deltas out to server-sent-event streams,
+    one channel per user.
+
+    Subscribers only see events published by the same process. A subscriber
+    that falls too far behind has its backlog dropped and gets a "resync"
+    event instead, telling the client to refetch the list.
+    """
+
+    def __init__(self, max_backlog=100):
+        self._subscribers = {}
+        self._lock = threading.Lock()
+        self._max_backlog = max_backlog
+
+    def publish(self, user_id, event_type, tasks):
+        """Send `tasks` (serialized task dicts, or {"id": ...} for deletes) to the user's streams."""
+        if not tasks:
+            return
+        event = {"type": event_type, "tasks": tasks}
+        with self._lock:
+            subscribers = list(self._subscribers.get(user_id, ()))
+        for backlog in subscribers:
+            try:
+                backlog.put_nowait(event)
+            except queue.Full:
+                self._drain(backlog)
+                backlog.put_nowait({"type": "resync", "tasks": []})
+
+    def stream(self, user_id, heartbeat=15):
+        """Yield SSE messages for `user_id` until the client disconnects."""
+        backlog = queue.Queue(maxsize=self._max_backlog)
+        with self._lock:
+            self._subscribers.setdefault(user_id, set()).add(backlog)
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                try:
+                    event = backlog.get(timeout=heartbeat)
+                except queue.Empty:
+                    # comment line keeps proxies from closing an idle stream
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+        finally:
+            with self._lock:
+                streams = self._subscribers.get(user_id, set())
+                streams.discard(backlog)
+                if not streams:
+                    self._subscribers.pop(user_id, None)
+
+    @staticmethod
+    def _drain(backlog):
+        try:
+            while True:
+                backlog.get_nowait()
+        except queue.Empty:
+            pass
@@ -0,0 +1,45 @@
+# export.py
+import csv
+import io
+import json
+
+# column order of the export rows, see the query in server.export_tasks
+EXPORT_COLUMNS = ("task_id", "brief_id", "brief_title", "agent", "description", "priority", "status", "created_at")
+
+
+def _values(row):
+    created_at = row.created_at.isoformat() if row.created_at else None
+    return tuple(row[:-1]) + (created_at,)
+
+
+def stream_ndjson(rows, batch=500):
+    """Yield one JSON object per row, `batch` lines per chunk."""
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(dict(zip(EXPORT_COLUMNS, _values(row)))))
+        if len(lines) >= batch:
+            yield "\n".join(lines) + "\n"
+            lines.clear()
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def stream_csv(rows, batch=500):
+    """Yield a header line and then `batch` CSV rows per chunk."""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(EXPORT_COLUMNS)
+    for count, row in enumerate(rows, 1):
+        writer.writerow(_values(row))
+        if count % batch == 0:
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
+    yield buf.getvalue()
+
+
+# format -> (streaming function, mimetype, file extension)
+EXPORT_FORMATS = {
+    "ndjson": (stream_ndjson, "application/x-ndjson", "ndjson"),
+    "csv": (stream_csv, "text/csv", "csv"),
+}
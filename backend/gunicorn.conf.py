@@ -0,0 +1,36 @@
+# gunicorn.conf.py
+"""
+Production serving settings, read from the environment.
+
+Run from backend/:  gunicorn -c gunicorn.conf.py
+
+One gthread worker serves GUNICORN_THREADS requests at once. It stays one
+process by default because background job progress (/api/jobs/<id>) and the
+task change feed (/api/tasks/<username>/events) live in process memory: with
+several workers, a poll or a change handled by another worker is never seen.
+Raise GUNICORN_WORKERS only behind a proxy that pins each client to one
+worker, or without the async route and the change feed.
+
+Every open change feed holds a thread for as long as the client stays
+connected, so SSE_STREAM_LIMIT (below the thread count) caps them and the
+remaining threads stay free for requests. GUNICORN_WORKER_CLASS=gevent
+(pip install gevent) serves streams as greenlets instead, and then the
+stream cap can be raised towards GUNICORN_WORKER_CONNECTIONS. Either way,
+ADMISSION_LIMIT bounds concurrent brief creations, and the rest get 429.
+"""
+import os
+
+wsgi_app = "server:create_app()"
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5000")
+# one process: jobs and task events are per-process state (see above)
+workers = int(os.getenv("GUNICORN_WORKERS", 1))
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+threads = int(os.getenv("GUNICORN_THREADS", 32))
+# greenlets per gevent worker
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", 1000))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 60))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", 5))
+# bounded listen queue: a full backlog refuses connections instead of queueing them
+backlog = int(os.getenv("GUNICORN_BACKLOG", 2048))
+accesslog = os.getenv("GUNICORN_ACCESS_LOG")
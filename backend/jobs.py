@@ -0,0 +1,84 @@
+# jobs.py
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+class JobQueue:
+    """
+    Runs multi-stage jobs on a local worker pool and tracks their progress.
+
+    In-process stand-in for an external queue: jobs live in memory, are only
+    visible to the process that accepted them and do not survive a restart.
+    """
+
+    def __init__(self, max_workers=4, keep=1000):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='brief-job')
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._keep = keep
+        self._pending = 0
+
+    def submit(self, stages, state=None, on_failure=None):
+        """
+        Queue a job and return its id.
+
+        `stages` is a list of (name, fn) pairs run in order; each fn receives
+        the shared `state` dict and the job's result is `state["result"]`.
+        `on_failure(state, exc)` runs if a stage raises.
+        """
+        job_id = uuid.uuid4().hex
+        job = {
+            "job_id": job_id,
+            "status": "queued",
+            "stage": None,
+            "completed_stages": [],
+            "total_stages": len(stages),
+            "result": None,
+            "error": None,
+            "created_at": time.time(),
+            "finished_at": None,
+        }
+        with self._lock:
+            self._jobs[job_id] = job
+            self._pending += 1
+            # Forget the oldest jobs once the history is full
+            while len(self._jobs) > self._keep:
+                self._jobs.popitem(last=False)
+        self._executor.submit(self._run, job, stages, dict(state or {}), on_failure)
+        return job_id
+
+    def pending(self):
+        """Number of jobs queued or running."""
+        with self._lock:
+            return self._pending
+
+    def get(self, job_id):
+        """Snapshot of a job's progress, or None if unknown."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            return dict(job, completed_stages=list(job["completed_stages"]))
+
+    def _run(self, job, stages, state, on_failure):
+        try:
+            for name, fn in stages:
+                with self._lock:
+                    job.update(status="running", stage=name)
+                fn(state)
+                with self._lock:
+                    job["completed_stages"].append(name)
+            with self._lock:
+                job.update(status="done", stage=None, result=state.get("result"))
+        except Exception as exc:
+            with self._lock:
+                job.update(status="failed", error=str(exc))
+            if on_failure is not None:
+                on_failure(state, exc)
+        finally:
+            with self._lock:
+                job["finished_at"] = time.time()
+                self._pending -= 1
@@ -0,0 +1,129 @@
+# metrics.py
+from bisect import bisect_left
+from contextlib import contextmanager
+import threading
+import time
+
+from flask import g, request
+
+# seconds; agent stages run in microseconds, requests in milliseconds
+LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+
+class Metrics:
+    """
+    In-process metrics in the Prometheus text format: a latency histogram
+    per pipeline stage and per route, plus event and request counters.
+
+    Stages are reported by both agents packages through the shared
+    instrumentation hooks and by the server through `timer`. Every worker
+    process keeps its own numbers, so scrape each one separately.
+    Streamed responses are timed until the response object is returned,
+    not until the last byte is sent.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages = {}
+        self._routes = {}
+        self._requests = {}
+        self._events = {}
+
+    def init_app(self, app):
+        import codegen
+
+        # both agent stacks report through the top-level agents' hooks
+        codegen.load('instrumentation').add_observer(self)
+        app.before_request(self._start_request)
+        app.after_request(self._finish_request)
+
+    # instrumentation observer interface
+    def observe(self, stage, seconds):
+        with self._lock:
+            self._histogram(self._stages, (stage,)).observe(seconds)
+
+    def increment(self, name, amount=1):
+        with self._lock:
+            self._events[(name,)] = self._events.get((name,), 0) + amount
+
+    @contextmanager
+    def timer(self, stage):
+        """Time the enclosed block as a pipeline stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def _start_request(self):
+        g.metrics_start = time.perf_counter()
+
+    def _finish_request(self, response):
+        start = g.pop('metrics_start', None)
+        if start is not None:
+            # the URL rule keeps label cardinality bounded (no ids or usernames)
+            route = request.url_rule.rule if request.url_rule else 'unmatched'
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._histogram(self._routes, (request.method, route)).observe(elapsed)
+                key = (request.method, route, str(response.status_code))
+                self._requests[key] = self._requests.get(key, 0) + 1
+        return response
+
+    @staticmethod
+    def _histogram(table, labels):
+        histogram = table.get(labels)
+        if histogram is None:
+            histogram = table[labels] = Histogram()
+        return histogram
+
+    def render(self):
+        """The current values in the Prometheus text exposition format (0.0.4)."""
+        lines = []
+        with self._lock:
+            _render_histograms(lines, 'pipeline_stage_duration_seconds', 'Time spent per pipeline stage.',
+                               ('stage',), self._stages)
+            _render_histograms(lines, 'http_request_duration_seconds', 'Request handling time per route.',
+                               ('method', 'route'), self._routes)
+            _render_counters(lines, 'http_requests_total', 'Requests handled per route and status.',
+                             ('method', 'route', 'status'), self._requests)
+            _render_counters(lines, 'pipeline_events_total', 'Events counted by the pipeline.',
+                             ('name',), self._events)
+        return '\n'.join(lines) + '\n'
+
+
+def _labels(names, values, **extra):
+    pairs = list(zip(names, values)) + list(extra.items())
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _render_histograms(lines, name, help_text, label_names, table):
+    lines += [f'# HELP {name} {help_text}', f'# TYPE {name} histogram']
+    for values, histogram in sorted(table.items()):
+        cumulative = 0
+        for bound, observed in zip(histogram.buckets + ('+Inf',), histogram.counts):
+            cumulative += observed
+            lines.append(f'{name}_bucket{_labels(label_names, values, le=bound)} {cumulative}')
+        lines.append(f'{name}_sum{_labels(label_names, values)} {histogram.sum}')
+        lines.append(f'{name}_count{_labels(label_names, values)} {cumulative}')
+
+
+def _render_counters(lines, name, help_text, label_names, table):
+    lines += [f'# HELP {name} {help_text}', f'# TYPE {name} counter']
+    for values, total in sorted(table.items()):
+        lines.append(f'{name}{_labels(label_names, values)} {total}')
@@ -9,26 +9,51 @@ class User(db.Model):
     user_id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False)
     email = db.Column(db.String(120), unique=True)
+    password_hash = db.Column(db.Text, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
-    briefs = db.relationship('ProjectBrief', backref='user', lazy=True)
+    briefs = db.relationship('ProjectBrief', back_populates='owner', lazy=True)
 
 class ProjectBrief(db.Model):
     __tablename__ = 'project_briefs'
     brief_id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('users.user_id'), nullable=False)
-    title = db.Column(db.String(200), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.user_id'), nullable=False, index=True)
+    title = db.Column(db.String(255), nullable=False)
     description = db.Column(db.Text, nullable=False)
+    status = db.Column(db.String(50), default='Pending')
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
-    tasks = db.relationship('TechnicalTask', backref='brief', lazy=True)
+    owner = db.relationship('User', back_populates='briefs')
+    tasks = db.relationship('TechnicalTask', back_populates='project_brief', lazy=True)
 
 class TechnicalTask(db.Model):
     __tablename__ = 'technical_tasks'
+    # keyset pagination walks a user's briefs by task_id
+    __table_args__ = (db.Index('ix_technical_tasks_brief_id_task_id', 'brief_id', 'task_id'),)
     task_id = db.Column(db.Integer, primary_key=True)
     brief_id = db.Column(db.Integer, db.ForeignKey('project_briefs.brief_id'), nullable=False)
     assigned_agent = db.Column(db.String(50), nullable=False)
     description = db.Column(db.Text, nullable=False)
     priority = db.Column(db.String(20), default='Medium')
-    status = db.Column(db.String(20), default='Pending')
+    status = db.Column(db.String(50), default='To Do')
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    # review/delete publish to the owner, so the brief is always needed with its tasks
+    project_brief = db.relationship('ProjectBrief', back_populates='tasks', lazy='selectin')
+
+class BriefReview(db.Model):
+    __tablename__ = 'brief_reviews'
+    # one row per brief, rewritten by the batch re-scoring job (rescore_briefs.py)
+    brief_id = db.Column(db.Integer, db.ForeignKey('project_briefs.brief_id'), primary_key=True)
+    clarity = db.Column(db.Float, nullable=False)
+    completeness = db.Column(db.Integer, nullable=False)
+    balance = db.Column(db.Integer, nullable=False)
+    reviewed_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+class TaskStat(db.Model):
+    __tablename__ = 'task_stats'
+    # per-user task counts by status, agent and priority, updated with every task write (stats.py)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.user_id'), primary_key=True)
+    dimension = db.Column(db.String(20), primary_key=True)
+    value = db.Column(db.String(50), primary_key=True)
+    count = db.Column(db.Integer, nullable=False, default=0)
@@ -0,0 +1,38 @@
+# reconcile_stats.py
+"""
+Recompute the per-user task counts in task_stats from technical_tasks and
+correct any that drifted, e.g. after tasks were changed outside the API.
+Run it once after upgrading an existing database, then periodically.
+
+Run from backend/:  python reconcile_stats.py [--user alice]
+"""
+import argparse
+import time
+
+from auth import resolve_user_id
+from models import db
+from server import create_app
+from stats import reconcile
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--user', help='reconcile only this username')
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        user_id = None
+        if args.user:
+            user_id = resolve_user_id(args.user)
+            if user_id is None:
+                parser.error(f"unknown user {args.user!r}")
+        start = time.perf_counter()
+        corrected = reconcile(user_id)
+        elapsed = time.perf_counter() - start
+    print(f"Corrected {corrected} counts in {elapsed:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
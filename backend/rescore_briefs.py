@@ -0,0 +1,84 @@
+# rescore_briefs.py
+"""
+Re-score every brief with the review agent's batch mode and store the
+scores in brief_reviews.
+
+Briefs are read in keyset-ordered chunks with their tasks, scored with one
+evaluate_many call per chunk and written back with one bulk delete and one
+bulk insert per chunk, each chunk in its own transaction.
+
+Run from backend/:  python rescore_briefs.py --chunk-size 2000
+"""
+import argparse
+import time
+from datetime import datetime
+
+from sqlalchemy import delete, insert
+
+from agents.review_agent import evaluate_many
+from models import db, BriefReview, ProjectBrief, TechnicalTask
+from server import create_app
+
+# stored agent name -> key of the generated-task dict the review agent reads
+AGENT_KEYS = {"Backend": "backend", "Frontend": "frontend"}
+
+
+def iter_chunks(chunk_size):
+    """Yield (brief ids, task sets) for consecutive chunks of briefs in id order."""
+    last_id = 0
+    while True:
+        ids = db.session.execute(
+            db.select(ProjectBrief.brief_id)
+            .where(ProjectBrief.brief_id > last_id)
+            .order_by(ProjectBrief.brief_id)
+            .limit(chunk_size)
+        ).scalars().all()
+        if not ids:
+            return
+        task_sets = {brief_id: {"backend": [], "frontend": []} for brief_id in ids}
+        rows = db.session.execute(
+            db.select(TechnicalTask.brief_id, TechnicalTask.assigned_agent, TechnicalTask.description)
+            .where(TechnicalTask.brief_id.between(ids[0], ids[-1]))
+        )
+        for brief_id, agent, description in rows:
+            key = AGENT_KEYS.get(agent)
+            if key:
+                task_sets[brief_id][key].append(description)
+        yield ids, [task_sets[brief_id] for brief_id in ids]
+        last_id = ids[-1]
+
+
+def rescore(chunk_size):
+    scored = 0
+    for ids, task_sets in iter_chunks(chunk_size):
+        scores = evaluate_many(task_sets)
+        now = datetime.utcnow()
+        db.session.execute(delete(BriefReview).where(BriefReview.brief_id.in_(ids)))
+        db.session.execute(insert(BriefReview), [
+            {"brief_id": brief_id, "clarity": float(clarity), "completeness": int(completeness),
+             "balance": int(balance), "reviewed_at": now}
+            for brief_id, clarity, completeness, balance
+            in zip(ids, scores["clarity"], scores["completeness"], scores["balance"])
+        ])
+        db.session.commit()
+        scored += len(ids)
+        print(f"scored {scored} briefs (through brief {ids[-1]})")
+    return scored
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--chunk-size', type=int, default=2000)
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        start = time.perf_counter()
+        scored = rescore(args.chunk_size)
+        elapsed = time.perf_counter() - start
+    print(f"Re-scored {scored} briefs in {elapsed:.2f}s ({scored / elapsed if elapsed else 0:.0f} briefs/s)")
+
+
+if __name__ == '__main__':
+    main()
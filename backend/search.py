@@ -0,0 +1,123 @@
+# search.py
+import re
+
+from sqlalchemy import event, text
+
+from models import db
+
+_WORD_RE = re.compile(r"\w+")
+
+# --- SQLite: external-content FTS5 tables kept in sync by triggers ---
+_SQLITE_INDEXES = {
+    "project_briefs_fts": (
+        "project_briefs", "brief_id", ("title", "description"),
+    ),
+    "technical_tasks_fts": (
+        "technical_tasks", "task_id", ("description",),
+    ),
+}
+
+
+def _sqlite_ddl(fts, table, key, columns):
+    cols = ", ".join(columns)
+    new = ", ".join(f"new.{c}" for c in columns)
+    old = ", ".join(f"old.{c}" for c in columns)
+    remove = f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.{key}, {old});"
+    add = f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.{key}, {new});"
+    return [
+        f"CREATE VIRTUAL TABLE {fts} USING fts5({cols}, content='{table}', content_rowid='{key}', "
+        f"tokenize='porter unicode61')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN {add} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN {remove} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {cols} ON {table} BEGIN {remove} {add} END",
+        # index the rows stored before search existed
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    ]
+
+
+_SQLITE_QUERIES = {
+    "brief": """
+        SELECT 'brief' AS type, b.brief_id AS id, b.brief_id AS brief_id, b.title AS title,
+               b.description AS text, -bm25(project_briefs_fts, 2.0, 1.0) AS score
+        FROM project_briefs_fts JOIN project_briefs b ON b.brief_id = project_briefs_fts.rowid
+        WHERE project_briefs_fts MATCH :match AND b.user_id = :user_id""",
+    "task": """
+        SELECT 'task' AS type, t.task_id AS id, t.brief_id AS brief_id, b.title AS title,
+               t.description AS text, -bm25(technical_tasks_fts) AS score
+        FROM technical_tasks_fts
+        JOIN technical_tasks t ON t.task_id = technical_tasks_fts.rowid
+        JOIN project_briefs b ON b.brief_id = t.brief_id
+        WHERE technical_tasks_fts MATCH :match AND b.user_id = :user_id""",
+}
+
+# --- PostgreSQL: GIN indexes on the same tsvector expressions the queries use ---
+_BRIEF_TSVECTOR = ("setweight(to_tsvector('english', {p}title), 'A') || "
+                   "setweight(to_tsvector('english', {p}description), 'B')")
+_TASK_TSVECTOR = "to_tsvector('english', {p}description)"
+
+_POSTGRES_DDL = [
+    f"CREATE INDEX IF NOT EXISTS ix_project_briefs_search ON project_briefs "
+    f"USING GIN (({_BRIEF_TSVECTOR.format(p='')}))",
+    f"CREATE INDEX IF NOT EXISTS ix_technical_tasks_search ON technical_tasks "
+    f"USING GIN (({_TASK_TSVECTOR.format(p='')}))",
+]
+
+_POSTGRES_QUERIES = {
+    "brief": f"""
+        SELECT 'brief' AS type, b.brief_id AS id, b.brief_id AS brief_id, b.title AS title,
+               b.description AS text, ts_rank({_BRIEF_TSVECTOR.format(p='b.')}, q) AS score
+        FROM project_briefs b, plainto_tsquery('english', :q) q
+        WHERE {_BRIEF_TSVECTOR.format(p='b.')} @@ q AND b.user_id = :user_id""",
+    "task": f"""
+        SELECT 'task' AS type, t.task_id AS id, t.brief_id AS brief_id, b.title AS title,
+               t.description AS text, ts_rank({_TASK_TSVECTOR.format(p='t.')}, q) AS score
+        FROM technical_tasks t JOIN project_briefs b ON b.brief_id = t.brief_id,
+             plainto_tsquery('english', :q) q
+        WHERE {_TASK_TSVECTOR.format(p='t.')} @@ q AND b.user_id = :user_id""",
+}
+
+SEARCH_TYPES = tuple(_SQLITE_QUERIES)
+
+
+@event.listens_for(db.metadata, "after_create")
+def create_search_indexes(target, connection, **kw):
+    """
+    Create the full-text indexes with the schema (db.create_all). The
+    database maintains them on every insert, update and delete, including
+    the set-based ones that bypass the ORM.
+    """
+    if connection.dialect.name == "sqlite":
+        existing = {row[0] for row in connection.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type = 'table'")}
+        for fts, (table, key, columns) in _SQLITE_INDEXES.items():
+            if fts not in existing:
+                for statement in _sqlite_ddl(fts, table, key, columns):
+                    connection.exec_driver_sql(statement)
+    elif connection.dialect.name == "postgresql":
+        for statement in _POSTGRES_DDL:
+            connection.exec_driver_sql(statement)
+
+
+def search(user_id, query, types=SEARCH_TYPES, limit=20, offset=0):
+    """
+    One page of the user's briefs and tasks matching every word of `query`,
+    best match first; returns (rows, has_more). Rows carry type, id,
+    brief_id, title, text and score.
+    """
+    words = _WORD_RE.findall(query.lower())
+    if not words:
+        return [], False
+    if db.engine.dialect.name == "sqlite":
+        queries = _SQLITE_QUERIES
+        # quoted so user input is never read as FTS5 query syntax
+        params = {"match": " ".join(f'"{w}"' for w in words)}
+    else:
+        queries = _POSTGRES_QUERIES
+        params = {"q": " ".join(words)}
+    union = " UNION ALL ".join(queries[t] for t in types)
+    # Fetch one extra row to know whether another page exists
+    rows = db.session.execute(
+        text(f"SELECT * FROM ({union}) AS hits ORDER BY score DESC, type, id LIMIT :limit OFFSET :offset"),
+        dict(params, user_id=user_id, limit=limit + 1, offset=offset),
+    ).all()
+    return rows[:limit], len(rows) > limit
@@ -0,0 +1,139 @@
+# similarity.py
+import re
+import threading
+import zlib
+
+import numpy as np
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def shingles(text):
+    """Word unigrams and bigrams of `text`, the units two briefs are compared on."""
+    words = _TOKEN_RE.findall(text.lower())
+    return set(words) | {f"{a} {b}" for a, b in zip(words, words[1:])}
+
+
+class BriefIndex:
+    """
+    In-memory MinHash/LSH index of brief texts for near-duplicate lookup.
+
+    Every brief is reduced to a `num_perm`-value MinHash signature; the
+    signature is cut into `bands` buckets, and briefs of the same group
+    (owner) sharing any bucket are candidates, ranked by their estimated
+    Jaccard similarity. Lookups cost one signature plus a few dict probes,
+    independent of index size.
+
+    Every indexed id is remembered, so adding a brief twice is harmless
+    and briefs may arrive in any order.
+    """
+
+    def __init__(self, num_perm=64, bands=8, seed=1, max_shingles=4096):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, _MERSENNE_PRIME, size=(num_perm, 1), dtype=np.uint64)
+        self._b = rng.integers(0, _MERSENNE_PRIME, size=(num_perm, 1), dtype=np.uint64)
+        self.num_perm = num_perm
+        self.bands = bands
+        self.max_shingles = max_shingles
+        self._rows = num_perm // bands
+        self._buckets = [{} for _ in range(bands)]
+        self._ids = []
+        self._signatures = np.empty((1024, num_perm), dtype=np.uint32)
+        self._lock = threading.Lock()
+        # ids added so far, including briefs without words, which get no signature
+        self._indexed = set()
+        # groups whose stored briefs have been loaded, and their highest indexed id, see server._brief_index
+        self._loaded_groups = set()
+        self._high_water = {}
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, brief_id):
+        return brief_id in self._indexed
+
+    def is_loaded(self, group):
+        return group in self._loaded_groups
+
+    def mark_loaded(self, group):
+        self._loaded_groups.add(group)
+
+    def high_water(self, group):
+        """Highest brief id indexed for `group`, 0 if none."""
+        return self._high_water.get(group, 0)
+
+    def signature(self, text):
+        return self.signatures([text])[0]
+
+    def signatures(self, texts):
+        """
+        MinHash signatures of many texts; None for texts without words.
+
+        Shingles are hashed in passes of at most `max_shingles`, so the
+        num_perm x shingles temporaries stay a few MiB however many or
+        however long the texts are.
+        """
+        shingled = [shingles(text) for text in texts]
+        counts = np.fromiter(map(len, shingled), dtype=np.int64, count=len(shingled))
+        hashes = np.fromiter((zlib.crc32(s.encode()) for group in shingled for s in group),
+                             dtype=np.uint64, count=int(counts.sum()))
+        owners = np.repeat(np.arange(len(shingled)), counts)
+        minima = np.full((self.num_perm, len(shingled)), np.iinfo(np.uint64).max, dtype=np.uint64)
+        for first in range(0, len(hashes), self.max_shingles):
+            chunk = hashes[first:first + self.max_shingles]
+            chunk_owners = owners[first:first + self.max_shingles]
+            # (a*x + b) mod p per permutation; uint64 overflow wraps like other MinHash implementations
+            permuted = (self._a * chunk + self._b) % np.uint64(_MERSENNE_PRIME)
+            # a text's shingles are contiguous, but one text may span several passes
+            starts = np.flatnonzero(np.concatenate(([True], chunk_owners[1:] != chunk_owners[:-1])))
+            columns = chunk_owners[starts]
+            minima[:, columns] = np.minimum(minima[:, columns], np.minimum.reduceat(permuted, starts, axis=1))
+        minima = (minima & np.uint64(0xFFFFFFFF)).astype(np.uint32)
+        return [minima[:, i] if count else None for i, count in enumerate(counts.tolist())]
+
+    def add(self, brief_id, text, group=None):
+        self.add_many([(brief_id, text, group)])
+
+    def add_many(self, items):
+        """Index (brief_id, text, group) triples, signing them together."""
+        items = list(items)
+        signatures = self.signatures([text for _, text, _ in items])
+        with self._lock:
+            for (brief_id, _, group), signature in zip(items, signatures):
+                if brief_id in self._indexed:
+                    continue
+                self._indexed.add(brief_id)
+                self._high_water[group] = max(brief_id, self._high_water.get(group, 0))
+                if signature is None:
+                    continue
+                position = len(self._ids)
+                if position == len(self._signatures):
+                    self._signatures = np.concatenate([self._signatures, np.empty_like(self._signatures)])
+                self._signatures[position] = signature
+                self._ids.append(brief_id)
+                for band, key in enumerate(self._band_keys(signature, group)):
+                    self._buckets[band].setdefault(key, []).append(position)
+
+    def query(self, text, group=None, threshold=0.8, limit=5):
+        """[(brief_id, estimated similarity)] for the group's briefs at or above `threshold`, best first."""
+        signature = self.signature(text)
+        if signature is None:
+            return []
+        with self._lock:
+            candidates = set()
+            for band, key in enumerate(self._band_keys(signature, group)):
+                candidates.update(self._buckets[band].get(key, ()))
+            if not candidates:
+                return []
+            positions = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+            scores = (self._signatures[positions] == signature).mean(axis=1)
+            ids = [self._ids[p] for p in positions]
+        ranked = sorted(zip(scores.tolist(), ids), reverse=True)
+        return [(brief_id, round(score, 3)) for score, brief_id in ranked[:limit] if score >= threshold]
+
+    def _band_keys(self, signature, group):
+        # hashed to ints to keep millions of bucket keys small; collisions only add candidates
+        return [hash((group, signature[i:i + self._rows].tobytes())) for i in range(0, self.num_perm, self._rows)]
@@ -0,0 +1,88 @@
+# stats.py
+from collections import Counter
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from models import db, ProjectBrief, TaskStat, TechnicalTask
+
+# dimension -> (key of a serialized task, column it is recomputed from)
+STAT_DIMENSIONS = {
+    "status": ("status", TechnicalTask.status),
+    "agent": ("agent", TechnicalTask.assigned_agent),
+    "priority": ("priority", TechnicalTask.priority),
+}
+
+_UPSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+def task_deltas(user_id, tasks, sign=1, deltas=None):
+    """
+    Add `sign` per task to a Counter of (user_id, dimension, value) deltas;
+    `tasks` are serialized tasks (see server._serialize_task).
+    """
+    deltas = Counter() if deltas is None else deltas
+    for task in tasks:
+        for dimension, (key, _) in STAT_DIMENSIONS.items():
+            deltas[(user_id, dimension, task[key] or "")] += sign
+    return deltas
+
+
+def apply_deltas(deltas):
+    """
+    Add the deltas to task_stats in the current transaction, so the counts
+    commit or roll back together with the task rows they describe.
+    """
+    rows = [
+        {"user_id": user_id, "dimension": dimension, "value": value, "count": delta}
+        for (user_id, dimension, value), delta in sorted(deltas.items()) if delta
+    ]
+    if not rows:
+        return
+    # atomic increments, so concurrent writers never overwrite each other's counts
+    stmt = _UPSERTS[db.engine.dialect.name](TaskStat)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[TaskStat.user_id, TaskStat.dimension, TaskStat.value],
+        set_={"count": TaskStat.count + stmt.excluded.count},
+    )
+    db.session.execute(stmt, rows)
+
+
+def user_stats(user_id):
+    """{"total": n, "status": {...}, "agent": {...}, "priority": {...}} from the counter rows."""
+    stats = {dimension: {} for dimension in STAT_DIMENSIONS}
+    rows = db.session.query(TaskStat.dimension, TaskStat.value, TaskStat.count).filter(
+        TaskStat.user_id == user_id, TaskStat.count != 0
+    )
+    for dimension, value, count in rows:
+        stats.setdefault(dimension, {})[value] = count
+    return dict(stats, total=sum(stats["status"].values()))
+
+
+def reconcile(user_id=None):
+    """
+    Recompute the counts of one user (or everyone) from technical_tasks and
+    correct the rows that drifted; returns the number of corrected counts.
+    """
+    actual = Counter()
+    for dimension, (_, column) in STAT_DIMENSIONS.items():
+        query = (
+            select(ProjectBrief.user_id, func.coalesce(column, ""), func.count())
+            .join(ProjectBrief, ProjectBrief.brief_id == TechnicalTask.brief_id)
+            .group_by(ProjectBrief.user_id, column)
+        )
+        if user_id is not None:
+            query = query.where(ProjectBrief.user_id == user_id)
+        for owner, value, count in db.session.execute(query):
+            actual[(owner, dimension, value)] += count
+
+    stored = db.session.query(TaskStat.user_id, TaskStat.dimension, TaskStat.value, TaskStat.count)
+    if user_id is not None:
+        stored = stored.filter(TaskStat.user_id == user_id)
+    drift = Counter(actual)
+    for owner, dimension, value, count in stored:
+        drift[(owner, dimension, value)] -= count
+    drift = Counter({key: delta for key, delta in drift.items() if delta})
+    apply_deltas(drift)
+    db.session.commit()
+    return len(drift)
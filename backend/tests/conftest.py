@@ -0,0 +1,29 @@
+import pytest
+
+from models import db
+from server import create_app
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = create_app({
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'test.db'}",
+        "JWT_SECRET_KEY": "test-secret-key-padded-to-32-bytes",
+        "TESTING": True,
+    })
+    with app.app_context():
+        db.create_all()
+    yield app
+    with app.app_context():
+        db.engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def user(client):
+    client.post('/api/auth/register', json={"username": "alice", "password": "secret"})
+    return "alice"
@@ -0,0 +1,27 @@
+from models import db, User
+
+
+def _login(client, username="alice", password="secret"):
+    return client.post('/api/auth/login', json={"username": username, "password": password})
+
+
+def test_token_identifies_the_caller(client, user):
+    token = _login(client).get_json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    created = client.post('/api/briefs', headers=headers, json={"title": "Notes", "description": "login form"})
+    assert created.status_code == 201
+    assert len(client.get(f'/api/tasks/{user}', headers=headers).get_json()["tasks"]) > 0
+
+    client.post('/api/auth/register', json={"username": "bob", "password": "pw"})
+    assert client.get('/api/tasks/bob', headers=headers).status_code == 403
+
+
+def test_login_rehashes_with_the_configured_method(app, client, user):
+    app.config["PASSWORD_HASH_METHOD"] = "pbkdf2:sha256:1000"
+    assert _login(client).status_code == 200
+    with app.app_context():
+        stored = db.session.query(User.password_hash).filter_by(username=user).scalar()
+    assert stored.startswith("pbkdf2:sha256:1000$")
+    assert _login(client).status_code == 200
+    assert _login(client, password="wrong").status_code == 401
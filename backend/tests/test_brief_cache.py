@@ -0,0 +1,19 @@
+import sqlite3
+import time
+
+from agents.brief_cache import BriefCache
+
+
+def test_writes_periodically_evict_expired_disk_rows(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    cache = BriefCache(max_entries=10, path=path, ttl=60, evict_every=2)
+    with sqlite3.connect(path) as conn:
+        conn.execute("INSERT INTO brief_cache VALUES ('old', '{}', ?)", (time.time() - 3600,))
+
+    cache.set('a', {"backend": []})
+    assert cache.get('old') is None
+    cache.set('b', {"backend": []})
+
+    with sqlite3.connect(path) as conn:
+        keys = {key for (key,) in conn.execute("SELECT key FROM brief_cache")}
+    assert keys == {'a', 'b'}
@@ -0,0 +1,20 @@
+from agents.review_agent import evaluate_many, evaluate_tasks
+
+TASK_SETS = [
+    {},
+    {"backend": ["Set up basic REST API structure."]},
+    {"frontend": ["Design  user interface\tcomponents and layout.", ""]},
+    {"backend": ["API", "Database schema and migrations"], "frontend": ["Login form"], "workflows": ["Auth flow"]},
+    {"backend": [" ".join(["word"] * 60)], "frontend": ["a b", "c d e", "f", "g h"]},
+    {"backend": ["caf\u00e9\u00a0menu\u2003api", "nul\0joined"], "frontend": ["x\x1fy", "\u3000"]},
+]
+
+
+def test_evaluate_many_matches_evaluate_tasks():
+    columns = evaluate_many(TASK_SETS)
+    for i, task_set in enumerate(TASK_SETS):
+        scores = evaluate_tasks(task_set)["review_scores"]
+        assert (columns["clarity"][i], columns["completeness"][i], columns["balance"][i]) == (
+            scores["clarity"], scores["completeness"], scores["balance"]
+        )
+    assert list(columns["workflows"]) == [0, 0, 0, 1, 0, 0]
@@ -0,0 +1,352 @@
+import gzip
+import io
+import json
+import tarfile
+import time
+import zipfile
+
+from models import db, ProjectBrief, User
+import server
+from server import create_app
+from stats import reconcile
+
+# app factory + engine construction, excluding first-import cost
+STARTUP_BUDGET_SECONDS = 0.5
+
+
+def test_create_app_startup_time(tmp_path):
+    mappers = len(db.Model.registry.mappers)
+    start = time.perf_counter()
+    for i in range(5):
+        create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / f'{i}.db'}"})
+    per_app = (time.perf_counter() - start) / 5
+    print(f"create_app: {per_app * 1000:.1f} ms")
+    assert per_app < STARTUP_BUDGET_SECONDS
+    # building apps never redefines the models
+    assert len(db.Model.registry.mappers) == mappers
+
+
+def test_create_brief_then_list_tasks(client, user):
+    created = client.post('/api/briefs', json={
+        "username": user, "title": "Task app", "description": "React dashboard with login and a REST API"
+    })
+    assert created.status_code == 201
+
+    listed = client.get(f'/api/tasks/{user}')
+    tasks = listed.get_json()["tasks"]
+    generated = created.get_json()["tasks"]
+    assert len(tasks) == len(generated["backend"]) + len(generated["frontend"])
+    assert [t["id"] for t in tasks] == sorted((t["id"] for t in tasks), reverse=True)
+    assert client.get(f'/api/tasks/{user}', headers={"If-None-Match": listed.headers["ETag"]}).status_code == 304
+
+
+def test_metrics_report_stages_and_routes(client, user):
+    client.post('/api/briefs', json={"username": user, "title": "Shop", "description": "Checkout form"})
+    body = client.get('/metrics').get_data(as_text=True)
+    assert 'pipeline_stage_duration_seconds_count{stage="brief.classify"}' in body
+    assert 'pipeline_stage_duration_seconds_count{stage="create_brief.commit_tasks"}' in body
+    assert 'http_requests_total{method="POST",route="/api/briefs",status="201"}' in body
+    assert 'http_request_duration_seconds_bucket{method="POST",route="/api/briefs",le="+Inf"}' in body
+
+
+def test_export_streams_filtered_tasks(client, user):
+    first = client.post('/api/briefs', json={"username": user, "title": "A", "description": "login api"}).get_json()
+    client.post('/api/briefs', json={"username": user, "title": "B", "description": "dashboard form"})
+
+    exported = client.get(f'/api/tasks/{user}/export?brief_id={first["brief_id"]}')
+    assert exported.mimetype == 'application/x-ndjson'
+    rows = [json.loads(line) for line in exported.get_data(as_text=True).splitlines()]
+    assert {row["brief_id"] for row in rows} == {first["brief_id"]}
+    assert len(rows) == len(first["tasks"]["backend"]) + len(first["tasks"]["frontend"])
+
+    csv_lines = client.get(f'/api/tasks/{user}/export?format=csv&since=2000-01-01').get_data(as_text=True).splitlines()
+    assert csv_lines[0].startswith("task_id,brief_id,brief_title")
+    assert len(csv_lines) > len(rows) + 1
+    assert client.get(f'/api/tasks/{user}/export?until=yesterday').status_code == 400
+
+
+def test_large_responses_are_gzipped_on_request(client, user):
+    for i in range(10):
+        client.post('/api/briefs', json={"username": user, "title": f"App {i}", "description": "login dashboard api"})
+
+    plain = client.get(f'/api/tasks/{user}')
+    assert "Content-Encoding" not in plain.headers
+
+    zipped = client.get(f'/api/tasks/{user}', headers={"Accept-Encoding": "gzip"})
+    assert zipped.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in zipped.headers["Vary"]
+    assert json.loads(gzip.decompress(zipped.get_data())) == plain.get_json()
+
+    revalidated = client.get(f'/api/tasks/{user}', headers={
+        "Accept-Encoding": "gzip", "If-None-Match": zipped.headers["ETag"]
+    })
+    assert revalidated.status_code == 304
+
+
+def test_compression_settings_are_per_app(tmp_path, client, user):
+    # a second app must not change how the first compresses
+    create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'other.db'}", "COMPRESS_MIN_SIZE": 10**9})
+    for i in range(10):
+        client.post('/api/briefs', json={"username": user, "title": f"App {i}", "description": "login dashboard api"})
+    assert client.get(f'/api/tasks/{user}', headers={"Accept-Encoding": "gzip"}).headers["Content-Encoding"] == "gzip"
+
+
+def test_near_duplicate_brief_is_offered_and_reused_on_request(client, user):
+    brief = {"username": user, "title": "Team tasks", "description": "Task tracker with login, a dashboard and a REST API"}
+    first = client.post('/api/briefs', json=brief).get_json()
+    assert "similar_brief" not in first
+
+    offered = client.post('/api/briefs', json=brief).get_json()
+    assert offered["similar_brief"]["brief_id"] == first["brief_id"]
+    assert offered["reused_tasks"] is False
+
+    reused = client.post('/api/briefs', json=dict(brief, reuse=True)).get_json()
+    assert reused["reused_tasks"] is True
+    assert reused["tasks"] == first["tasks"]
+    assert reused["tasks"]["workflows"]
+
+    client.post('/api/auth/register', json={"username": "bob", "password": "pw"})
+    other = client.post('/api/briefs', json=dict(brief, username="bob")).get_json()
+    assert "similar_brief" not in other
+
+
+def test_similarity_index_picks_up_briefs_committed_out_of_order(app, client, user):
+    client.post('/api/briefs', json={"username": user, "title": "Blog", "description": "Posts and comments"})
+    with app.app_context():
+        user_id = db.session.query(User.user_id).filter_by(username=user).scalar()
+        late = ProjectBrief(user_id=user_id, title="Inventory", description="Warehouse stock levels and reorder alerts")
+        early = ProjectBrief(user_id=user_id, title="Recipes", description="Meal planner")
+        db.session.add_all([late, early])
+        db.session.commit()
+        # another writer indexed the higher id before this one committed the lower
+        app.extensions["brief_index"].add(early.brief_id, "recipes meal planner", group=user_id)
+        late_id = late.brief_id
+
+    again = client.post('/api/briefs', json={
+        "username": user, "title": "Inventory", "description": "Warehouse stock levels and reorder alerts"
+    }).get_json()
+    assert again["similar_brief"]["brief_id"] == late_id
+
+
+def test_similarity_index_covers_batches_larger_than_the_rescan_window(app, client, user):
+    app.config["BRIEF_INDEX_RESCAN"] = 10
+    client.post('/api/briefs', json={"username": user, "title": "Blog", "description": "Posts and comments"})
+    batch = [{"username": user, "title": f"App {i}", "description": f"ledger{i} kiosk{i} rota{i} tally{i}"}
+             for i in range(30)]
+    created = client.post('/api/briefs/batch', json=batch).get_json()["results"]
+
+    for item, result in ((batch[0], created[0]), (batch[-1], created[-1])):
+        again = client.post('/api/briefs', json=item).get_json()
+        assert again["similar_brief"] == {"brief_id": result["brief_id"], "title": item["title"], "similarity": 1.0}
+
+    queued = client.post('/api/briefs/async', json={"username": user, "title": "Zoo", "description": "Animal feeding rota"})
+    again = client.post('/api/briefs', json={"username": user, "title": "Zoo", "description": "Animal feeding rota"})
+    assert again.get_json()["similar_brief"]["brief_id"] == queued.get_json()["brief_id"]
+    _wait_for_job(client, queued.get_json()["status_url"])
+
+
+def test_search_ranks_scopes_and_tracks_deletes(client, user):
+    client.post('/api/auth/register', json={"username": "bob", "password": "pw"})
+    client.post('/api/briefs', json={"username": "bob", "title": "Inventory", "description": "Warehouse stock"})
+    client.post('/api/briefs', json={"username": user, "title": "Blog", "description": "Posts mention inventory once"})
+    best = client.post('/api/briefs', json={"username": user, "title": "Inventory", "description": "Inventory login api"}).get_json()
+
+    found = client.get(f'/api/search?username={user}&q=inventories&type=brief').get_json()
+    assert [r["brief_id"] for r in found["results"]][0] == best["brief_id"]
+    assert len(found["results"]) == 2 and found["next_offset"] is None
+    assert client.get(f'/api/search?username={user}&q=warehouse').get_json()["results"] == []
+
+    first_page = client.get(f'/api/search?username={user}&q=inventory&limit=1').get_json()
+    assert len(first_page["results"]) == 1 and first_page["next_offset"] == 1
+
+    task_hits = client.get(f'/api/search?username={user}&q={best["tasks"]["backend"][0]}&type=task').get_json()["results"]
+    assert task_hits and task_hits[0]["brief_id"] == best["brief_id"]
+    client.delete(f'/api/tasks/{task_hits[0]["id"]}')
+    after = client.get(f'/api/search?username={user}&q={best["tasks"]["backend"][0]}&type=task').get_json()["results"]
+    assert task_hits[0]["id"] not in [r["id"] for r in after]
+    assert client.get(f'/api/search?username={user}&q=').status_code == 400
+
+
+def test_stats_follow_task_writes_and_reconcile_fixes_drift(app, client, user):
+    created = client.post('/api/briefs', json={"username": user, "title": "Shop", "description": "login api dashboard"}).get_json()
+    total = len(created["tasks"]["backend"]) + len(created["tasks"]["frontend"])
+    task_ids = [t["id"] for t in client.get(f'/api/tasks/{user}').get_json()["tasks"]]
+
+    client.post(f'/api/review/{task_ids[0]}')
+    client.post(f'/api/review/{task_ids[0]}')
+    client.delete(f'/api/tasks/{task_ids[1]}')
+    client.delete('/api/tasks/batch', json={"task_ids": task_ids[2:3]})
+
+    stats = client.get(f'/api/stats/{user}').get_json()
+    assert stats["total"] == total - 2
+    assert stats["status"] == {"Reviewed": 1, "To Do": total - 3}
+    assert sum(stats["agent"].values()) == sum(stats["priority"].values()) == total - 2
+
+    with app.app_context():
+        assert reconcile() == 0
+        db.session.execute(db.text("UPDATE task_stats SET count = 99 WHERE dimension = 'priority'"))
+        db.session.commit()
+        assert reconcile() > 0
+    assert client.get(f'/api/stats/{user}').get_json() == stats
+
+
+def test_overloaded_brief_routes_answer_429_with_retry_after(tmp_path):
+    app = create_app({
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'busy.db'}",
+        "ADMISSION_LIMIT": 1,
+        "ADMISSION_WAIT": 0,
+        "BRIEF_JOB_BACKLOG": 0,
+        "SSE_STREAM_LIMIT": 0,
+    })
+    with app.app_context():
+        db.create_all()
+    client = app.test_client()
+    client.post('/api/auth/register', json={"username": "alice", "password": "secret"})
+    brief = {"username": "alice", "title": "Shop", "description": "Checkout form"}
+    assert client.post('/api/briefs', json=brief).status_code == 201
+
+    app.extensions["admission"].acquire()  # a brief creation in flight
+    busy = client.post('/api/briefs', json=brief)
+    assert busy.status_code == 429 and busy.headers["Retry-After"] == "1"
+    assert client.get('/api/tasks/alice').status_code == 200
+    app.extensions["admission"].release()
+
+    assert client.post('/api/briefs/async', json=brief).status_code == 429
+    assert client.get('/api/tasks/alice/events').status_code == 429
+    assert 'pipeline_events_total{name="admission.rejected"}' in client.get('/metrics').get_data(as_text=True)
+
+
+def test_batch_creates_briefs_and_reports_each_item(app, client, user):
+    good = {"username": user, "title": "Shop", "description": "Checkout form with login"}
+    created = client.post('/api/briefs/batch', json=[good, dict(good, title="Blog")])
+    assert created.status_code == 201
+    assert [r["status"] for r in created.get_json()["results"]] == [201, 201]
+
+    ndjson = "\n".join(json.dumps(b) for b in [good, dict(good, username="nobody"), dict(good, username=["alice"])])
+    partial = client.post('/api/briefs/batch', data=ndjson + "\n", content_type='application/x-ndjson')
+    assert partial.status_code == 207
+    results = partial.get_json()["results"]
+    assert [r["status"] for r in results] == [201, 404, 400]
+    assert results[0]["tasks"]["backend"]
+
+    assert client.post('/api/briefs/batch', json={"briefs": "nope"}).status_code == 400
+    app.config["BRIEF_BATCH_LIMIT"] = 1
+    assert client.post('/api/briefs/batch', json=[good, good]).status_code == 413
+    per_brief = len(results[0]["tasks"]["backend"]) + len(results[0]["tasks"]["frontend"])
+    assert len(client.get(f'/api/tasks/{user}?limit=500').get_json()["tasks"]) == 3 * per_brief
+
+
+def _wait_for_job(client, status_url, timeout=10):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = client.get(status_url).get_json()
+        # set once the failure handler, if any, has run too
+        if job["finished_at"] is not None:
+            return job
+        time.sleep(0.02)
+    raise AssertionError(f"job did not finish: {job}")
+
+
+def test_async_brief_runs_every_stage_and_persists_tasks(client, user):
+    accepted = client.post('/api/briefs/async', json={"username": user, "title": "Shop", "description": "login api"})
+    assert accepted.status_code == 202
+    body = accepted.get_json()
+    assert body["status_url"] == f"/api/jobs/{body['job_id']}"
+
+    job = _wait_for_job(client, body["status_url"])
+    assert job["status"] == "done"
+    assert job["completed_stages"] == ["coordinator", "agents", "review", "persist"]
+    assert job["result"]["brief_id"] == body["brief_id"]
+    generated = job["result"]["tasks"]
+    assert len(client.get(f'/api/tasks/{user}').get_json()["tasks"]) == len(generated["backend"]) + len(generated["frontend"])
+    assert client.get('/api/jobs/unknown').status_code == 404
+
+
+def test_failing_async_stage_marks_the_brief_failed(app, client, user, monkeypatch):
+    def broken(state):
+        raise RuntimeError("agents unavailable")
+    monkeypatch.setattr(server, "BRIEF_STAGES", [server.BRIEF_STAGES[0], ("agents", broken)])
+
+    body = client.post('/api/briefs/async', json={"username": user, "title": "Shop", "description": "login"}).get_json()
+    job = _wait_for_job(client, body["status_url"])
+    assert job["status"] == "failed" and job["error"] == "agents unavailable"
+    assert job["completed_stages"] == ["coordinator"]
+    with app.app_context():
+        assert db.session.get(ProjectBrief, body["brief_id"]).status == "Failed"
+
+
+def test_batch_and_brief_review_report_missing_tasks(client, user):
+    brief = client.post('/api/briefs', json={"username": user, "title": "Shop", "description": "login api"}).get_json()
+    task_ids = sorted(t["id"] for t in client.get(f'/api/tasks/{user}').get_json()["tasks"])
+
+    reviewed = client.post('/api/review/batch', json={"task_ids": [task_ids[0], 999999, task_ids[0]]}).get_json()
+    assert [r["task_id"] for r in reviewed["reviews"]] == [task_ids[0]]
+    assert reviewed["reviews"][0]["status"] == "Reviewed"
+    assert reviewed["not_found"] == [999999]
+    assert client.post('/api/review/batch', json={"task_ids": [True]}).status_code == 400
+    assert client.post('/api/review/batch', json={"task_ids": []}).status_code == 400
+
+    whole = client.post(f'/api/briefs/{brief["brief_id"]}/review').get_json()
+    assert sorted(r["task_id"] for r in whole["reviews"]) == task_ids
+    assert {t["status"] for t in client.get(f'/api/tasks/{user}').get_json()["tasks"]} == {"Reviewed"}
+    assert client.post('/api/briefs/999999/review').status_code == 404
+
+
+def test_task_pages_follow_the_cursor_and_filters(client, user):
+    for title in ("Shop", "Blog"):
+        client.post('/api/briefs', json={"username": user, "title": title, "description": "login api dashboard form"})
+    everything = client.get(f'/api/tasks/{user}?limit=500').get_json()["tasks"]
+    backend_ids = [t["id"] for t in everything if t["agent"] == "Backend"]
+    client.post('/api/review/batch', json={"task_ids": backend_ids[:3]})
+
+    seen, cursor = [], None
+    while True:
+        page = client.get(f'/api/tasks/{user}?limit=2&agent=Backend' + (f'&cursor={cursor}' if cursor else '')).get_json()
+        assert len(page["tasks"]) <= 2
+        seen += [t["id"] for t in page["tasks"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == backend_ids
+
+    reviewed = client.get(f'/api/tasks/{user}?status=Reviewed&agent=Backend&priority=High').get_json()
+    assert [t["id"] for t in reviewed["tasks"]] == backend_ids[:3]
+    assert client.get(f'/api/tasks/{user}?agent=Nobody').get_json() == {"tasks": [], "next_cursor": None}
+
+
+def test_artifacts_stream_as_zip_or_tar_gz(client, user):
+    brief = client.post('/api/briefs', json={"username": user, "title": "Shop", "description": "login api dashboard"}).get_json()
+    url = f'/api/briefs/{brief["brief_id"]}/artifacts'
+
+    as_zip = client.get(url)
+    assert as_zip.status_code == 200 and as_zip.mimetype == 'application/zip'
+    assert f'brief-{brief["brief_id"]}-artifacts.zip' in as_zip.headers["Content-Disposition"]
+    with zipfile.ZipFile(io.BytesIO(as_zip.data)) as zf:
+        zipped = {name: zf.read(name) for name in zf.namelist()}
+
+    as_tar = client.get(url + '?format=tar.gz')
+    assert as_tar.status_code == 200 and as_tar.mimetype == 'application/gzip'
+    with tarfile.open(fileobj=io.BytesIO(as_tar.data), mode='r:gz') as tf:
+        tarred = {member.name: tf.extractfile(member).read() for member in tf.getmembers()}
+
+    assert zipped and zipped == tarred
+    assert client.get(url + '?format=rar').status_code == 400
+    assert client.get('/api/briefs/999999/artifacts').status_code == 404
+
+
+def test_task_events_stream_deltas_to_the_user(client, user):
+    client.post('/api/briefs', json={"username": user, "title": "Shop", "description": "login api dashboard"})
+    task_id = client.get(f'/api/tasks/{user}?limit=1').get_json()["tasks"][0]["id"]
+
+    response = client.get(f'/api/tasks/{user}/events', buffered=False)
+    assert response.status_code == 200 and response.mimetype == 'text/event-stream'
+    chunks = iter(response.response)
+    assert next(chunks) == b"retry: 3000\n\n"
+
+    client.delete(f'/api/tasks/{task_id}')
+    event_line, data_line = next(chunks).decode().strip().split("\n")
+    assert event_line == "event: deleted"
+    assert json.loads(data_line.removeprefix("data: ")) == {"type": "deleted", "tasks": [{"id": task_id}]}
+    response.close()
+
+    assert client.get('/api/tasks/nobody/events').status_code == 404
@@ -0,0 +1,3 @@
+# backend/ ships its own `agents` package that shadows the top-level one, so its
+# suite runs separately: cd backend && python -m pytest tests
+collect_ignore = ["backend"]
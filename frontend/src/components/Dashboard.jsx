@@ -1,8 +1,9 @@
 // Dashboard.jsx
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { LayoutDashboard as DashboardIcon, ListChecks, PlusCircle, CheckCircle, X } from 'lucide-react';
 import GenericCard from './GenericCard';
 import NewBriefModal from './NewBriefModal'; 
+import authHeaders from './authHeaders';
 import './styles.CSS';
 
 // NOTE: Adjusted imports - removed unused 'Share'
@@ -42,6 +43,10 @@ const Dashboard = ({ user, onLogout }) => {
     const [tasks, setTasks] = useState([]);
     const [isModalVisible, setIsModalVisible] = useState(false);
     const [loading, setLoading] = useState(true);
+    // ETag and body of each page from the last fetch, keyed by cursor
+    const pageCache = useRef({});
+    // Server-sent change feed; while it is open, deltas replace full refetches
+    const eventsRef = useRef(null);
 
     // Function to fetch tasks from the Backend API
   const fetchTasks = async () => {
@@ -50,13 +55,33 @@ const Dashboard = ({ user, onLogout }) => {
   if (!currentUser) return onLogout();
 
   try {
-    const response = await fetch(`${API_URL}/api/tasks/${currentUser}`);
-    // Check for HTTP errors before parsing JSON
-    if (!response.ok) {
-      throw new Error(`HTTP error! status: ${response.status}`);
-    }
-    const data = await response.json();
-    setTasks(data.tasks || []);
+    // The list is paginated by cursor; follow next_cursor until the last page
+    const allTasks = [];
+    let cursor = null;
+    do {
+      const key = cursor || 'first';
+      const cached = pageCache.current[key];
+      const query = cursor ? `?cursor=${cursor}` : '';
+      // Conditional request: an unchanged page comes back as an empty 304
+      const response = await fetch(`${API_URL}/api/tasks/${currentUser}${query}`, {
+        headers: { ...authHeaders(), ...(cached ? { 'If-None-Match': cached.etag } : {}) }
+      });
+      let data;
+      if (response.status === 304 && cached) {
+        data = cached.data;
+      } else {
+        // Check for HTTP errors before parsing JSON
+        if (!response.ok) {
+          throw new Error(`HTTP error! status: ${response.status}`);
+        }
+        data = await response.json();
+        const etag = response.headers.get('ETag');
+        if (etag) pageCache.current[key] = { etag, data };
+      }
+      allTasks.push(...(data.tasks || []));
+      cursor = data.next_cursor;
+    } while (cursor);
+    setTasks(allTasks);
   } catch (error) {
     console.error("Error fetching tasks:", error);
   } finally {
@@ -64,6 +89,12 @@ const Dashboard = ({ user, onLogout }) => {
   }
 };
 
+  // Refetch only when the change feed is not connected
+  const refreshIfNotLive = () => {
+    const source = eventsRef.current;
+    if (!source || source.readyState !== EventSource.OPEN) fetchTasks();
+  };
+
     // --- DELETE TASK --- (Moved inside Dashboard to access fetchTasks)
   const handleDeleteTask = async (taskId) => {
     try {
@@ -74,7 +105,7 @@ const Dashboard = ({ user, onLogout }) => {
         throw new Error(`Failed to delete task: ${response.status}`);
       }
       // Optional: const data = await response.json(); console.log(data.msg);
-      fetchTasks(); // refresh
+      refreshIfNotLive(); // the change feed delivers the delta otherwise
     } catch (error) {
       console.error('Delete error:', error);
       alert('Failed to delete task.');
@@ -92,7 +123,7 @@ const Dashboard = ({ user, onLogout }) => {
       }
       const data = await response.json();
       alert(`Review: ${data.feedback}`);
-      fetchTasks(); // refresh
+      refreshIfNotLive(); // the change feed delivers the delta otherwise
     } catch (error) {
       console.error('Review error:', error);
       alert('Failed to review task.');
@@ -104,10 +135,46 @@ const Dashboard = ({ user, onLogout }) => {
         fetchTasks();
     }, []); // Empty dependency array means this runs once on mount
 
+    // Subscribe to task deltas pushed by the server and apply them locally
+    useEffect(() => {
+        const currentUser = localStorage.getItem("current_username");
+        if (!currentUser || !window.EventSource) return undefined;
+
+        const source = new EventSource(`${API_URL}/api/tasks/${currentUser}/events`);
+        eventsRef.current = source;
+        const parse = (event) => JSON.parse(event.data).tasks;
+
+        source.addEventListener('created', (event) => {
+            const created = parse(event);
+            const ids = new Set(created.map(t => t.id));
+            setTasks(prev => [...created, ...prev.filter(t => !ids.has(t.id))].sort((a, b) => b.id - a.id));
+        });
+        source.addEventListener('updated', (event) => {
+            const updated = new Map(parse(event).map(t => [t.id, t]));
+            setTasks(prev => prev.map(t => updated.get(t.id) || t));
+        });
+        source.addEventListener('deleted', (event) => {
+            const deleted = new Set(parse(event).map(t => t.id));
+            setTasks(prev => prev.filter(t => !deleted.has(t.id)));
+        });
+        // Deltas may have been missed: catch up with a conditional refetch
+        source.addEventListener('resync', () => fetchTasks());
+        let connectedBefore = false;
+        source.onopen = () => {
+            if (connectedBefore) fetchTasks();
+            connectedBefore = true;
+        };
+
+        return () => {
+            source.close();
+            eventsRef.current = null;
+        };
+    }, []);
+
     const handleBriefSubmitted = () => {
         // Close modal and refresh task list after submission
         setIsModalVisible(false);
-        fetchTasks();
+        refreshIfNotLive();
     };
 
     const handleLogoutClick = () => {
@@ -1,14 +1,29 @@
 import React, { useState } from 'react';
 import { X, Send, BookOpen } from 'lucide-react';
+import authHeaders from './authHeaders';
 import './styles.CSS';
 
 const API_URL = process.env.REACT_APP_API_URL || 'http://localhost:5000';
+const JOB_POLL_MS = 500;
+
+// Poll a background job until it has finished, reporting each snapshot
+const waitForJob = async (statusUrl, onProgress) => {
+    while (true) {
+        const response = await fetch(`${API_URL}${statusUrl}`, { headers: authHeaders() });
+        if (!response.ok) throw new Error(`Job status request failed: ${response.status}`);
+        const job = await response.json();
+        if (job.finished_at) return job;
+        onProgress(job);
+        await new Promise(resolve => setTimeout(resolve, JOB_POLL_MS));
+    }
+};
 
 const NewBriefModal = ({ isVisible, onClose, onBriefSubmitted }) => {
 const [title, setTitle] = useState('');
 const [description, setDescription] = useState('');
 const [loading, setLoading] = useState(false);
 const [error, setError] = useState('');
+const [progress, setProgress] = useState('');
 
 if (!isVisible) return null;
 
@@ -25,28 +40,36 @@ const handleSubmit = async (e) => {
     }
 
     try {
-        const response = await fetch(`${API_URL}/api/briefs`, {
+        // The agents run on a background worker; the request only queues the brief
+        const response = await fetch(`${API_URL}/api/briefs/async`, {
             method: 'POST',
-            headers: { 'Content-Type': 'application/json' },
+            headers: { 'Content-Type': 'application/json', ...authHeaders() },
             body: JSON.stringify({ username, title, description }),
         });
 
         const data = await response.json();
 
-        if (response.ok) {
-            console.log(data.msg);
-            onBriefSubmitted(data.brief_id);
-            setTitle('');
-            setDescription('');
-            onClose();
-        } else {
+        if (!response.ok) {
             setError(data.msg || `Failed to submit brief. Status: ${response.status}`);
+            return;
+        }
+        console.log(data.msg);
+        const job = await waitForJob(data.status_url, (snapshot) =>
+            setProgress(`${snapshot.completed_stages.length}/${snapshot.total_stages}`));
+        if (job.status === 'failed') {
+            setError(`Brief processing failed: ${job.error}`);
+            return;
         }
+        onBriefSubmitted(data.brief_id);
+        setTitle('');
+        setDescription('');
+        onClose();
     } catch (err) {
         setError('Connection error. Please ensure the backend server is running.');
         console.error(err);
     } finally {
         setLoading(false);
+        setProgress('');
     }
 };
 
@@ -79,7 +102,7 @@ return (
                     className="form-input modal-textarea"
                 />
                 <button type="submit" className="btn-primary" disabled={loading}>
-                    {loading ? 'Sending...' : 'Submit Brief to Coordinator'}
+                    {loading ? (progress ? `Processing (${progress})...` : 'Sending...') : 'Submit Brief to Coordinator'}
                     <Send className="w-4 h-4 ml-2" />
                 </button>
             </form>
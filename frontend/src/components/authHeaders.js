@@ -0,0 +1,8 @@
+// authHeaders.js
+// Bearer token from login; the API reads the user id from it instead of looking up the username.
+const authHeaders = () => {
+    const token = localStorage.getItem('access_token');
+    return token ? { Authorization: `Bearer ${token}` } : {};
+};
+
+export default authHeaders;
@@ -1,24 +1,137 @@
 # run_coordinator.py
+"""
+Generate code for one demo brief, or for every brief in a JSONL file.
+
+Each JSONL line is a JSON string, or an object with a "brief" (or
+"title"/"description") and an optional "name" that names the project's
+output directory. Briefs are spread over a process pool; every project is
+written to <out>/<name>/{frontend,backend}.
+
+    python run_coordinator.py
+    python run_coordinator.py --briefs portfolio.jsonl --out generated --workers 4
+    cat portfolio.jsonl | python run_coordinator.py --briefs -
+"""
 from agents.coordinator import CoordinatorAgent
+from agents.artifact_sink import ArtifactSink
+from concurrent.futures import ProcessPoolExecutor
+import argparse
 import json
+import os
+import re
+import sys
+import time
 
-if __name__ == '__main__':
-    brief = "Build a task management app with user authentication and task sharing"
+DEMO_BRIEF = "Build a task management app with user authentication and task sharing"
+
+# one agent per worker process, so its template and output caches are reused across briefs
+_agent = None
+
+
+def read_briefs(stream):
+    """
+    Yield (name, brief, error) for every non-blank JSONL line of `stream`,
+    with names unique (ignoring case) and path-safe. Lines that are not a
+    JSON string or object get an error message instead of a brief.
+    """
+    seen = set()
+    for number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+        except ValueError as exc:
+            item, error = {}, f'invalid JSON: {exc}'
+        else:
+            error = None
+        if isinstance(item, str):
+            item = {'brief': item}
+        elif not isinstance(item, dict):
+            item, error = {}, f'expected a JSON string or object, got {type(item).__name__}'
+        brief = item.get('brief') or f"{item.get('title', '')} {item.get('description', '')}".strip()
+        name = re.sub(r'[^A-Za-z0-9._-]+', '-', str(item.get('name') or item.get('title') or '')).strip('-.')
+        name = name or f'brief-{number:04d}'
+        # case-insensitive file systems would merge "Shop" and "shop"
+        if name.lower() in seen:
+            name = f'{name}-{number}'
+        seen.add(name.lower())
+        yield name, brief, error
+
+
+def _init_worker():
+    global _agent
+    _agent = CoordinatorAgent()
+
+
+def process_one(job):
+    """Render one brief and sync it to disk; returns (name, seconds, files written, error)."""
+    name, brief, out_dir = job
+    start = time.perf_counter()
+    try:
+        out = _agent.process_brief(brief)
+        written = 0
+        for side in ('frontend', 'backend'):
+            written += ArtifactSink(os.path.join(out_dir, name, side)).write(out[side])['written']
+    except Exception as exc:  # reported per brief; the rest of the portfolio still runs
+        return name, time.perf_counter() - start, 0, f'{type(exc).__name__}: {exc}'
+    return name, time.perf_counter() - start, written, None
+
+
+def run_portfolio(briefs, out_dir, workers):
+    briefs = list(briefs)
+    jobs = [(name, brief, out_dir) for name, brief, error in briefs if error is None]
+    start = time.perf_counter()
+    if workers == 1:
+        _init_worker()
+        results = map(process_one, jobs)
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+        results = pool.map(process_one, jobs, chunksize=max(1, len(jobs) // (workers * 4)))
+
+    failed = 0
+    for name, _, error in briefs:
+        if error is not None:
+            print(f'{name:40} {0:8.1f} ms  error: {error}')
+            failed += 1
+    for name, seconds, written, error in results:
+        status = f'error: {error}' if error else f'{written} files written'
+        print(f'{name:40} {seconds * 1000:8.1f} ms  {status}')
+        failed += bool(error)
+    if workers != 1:
+        pool.shutdown()
+
+    elapsed = time.perf_counter() - start
+    print(f'{len(briefs)} briefs in {elapsed:.2f}s ({len(jobs) / elapsed if elapsed else 0:.1f} briefs/s) '
+          f'with {workers} worker(s), {failed} failed')
+    return failed
+
+
+def run_demo():
     c = CoordinatorAgent()
-    out = c.process_brief(brief)
+    out = c.process_brief(DEMO_BRIEF)
     print('--- FRONTEND ---')
     print('\n'.join(out['frontend'].keys()))
     print('--- BACKEND ---')
     print('\n'.join(out['backend'].keys()))
 
-    # write artifacts to disk (optional)
-    import os
-    os.makedirs('generated/frontend', exist_ok=True)
-    os.makedirs('generated/backend', exist_ok=True)
-    for fn, code in out['frontend'].items():
-        with open(os.path.join('generated/frontend', fn), 'w', encoding='utf-8') as f:
-            f.write(code)
-    for fn, code in out['backend'].items():
-        with open(os.path.join('generated/backend', fn), 'w', encoding='utf-8') as f:
-            f.write(code)
-    print('Wrote generated files into ./generated/')
\ No newline at end of file
+    # write artifacts to disk (optional) - unchanged files are left untouched
+    for side in ('frontend', 'backend'):
+        counts = ArtifactSink(os.path.join('generated', side)).write(out[side])
+        print(f"generated/{side}: {counts['written']} written, {counts['skipped']} unchanged, {counts['removed']} removed")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--briefs', help="JSONL file of briefs, or '-' for stdin")
+    parser.add_argument('--out', default='generated', help='parent directory of the per-project outputs')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    if not args.briefs:
+        run_demo()
+    else:
+        if args.briefs == '-':
+            briefs = list(read_briefs(sys.stdin))
+        else:
+            with open(args.briefs, encoding='utf-8') as f:
+                briefs = list(read_briefs(f))
+        sys.exit(1 if run_portfolio(briefs, args.out, max(1, args.workers)) else 0)
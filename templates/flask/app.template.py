@@ -0,0 +1,16 @@
+from flask import Blueprint, request, jsonify
+
+{% set name = feature.lower().replace(' ', '_') %}
+{{ name }}_bp = Blueprint('{{ name }}', __name__)
+
+# {{ feature }}
+@{{ name }}_bp.route('/api/{{ name }}', methods=['GET'])
+def list_{{ name }}():
+    # TODO: Fetch {{ feature }} records from database
+    return jsonify([])
+
+@{{ name }}_bp.route('/api/{{ name }}', methods=['POST'])
+def create_{{ name }}():
+    data = request.get_json() or {}
+    # TODO: Validate and save to DB
+    return jsonify({'message': '{{ feature }} created', 'data': data}), 201
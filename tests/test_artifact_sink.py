@@ -0,0 +1,15 @@
+import os
+
+from agents.artifact_sink import ArtifactSink
+
+
+def test_sink_skips_unchanged_and_removes_stale(tmp_path):
+    sink = ArtifactSink(str(tmp_path))
+    assert sink.write({'a.py': 'one', 'b.py': 'two'}) == {'written': 2, 'skipped': 0, 'removed': 0}
+    mtime = os.stat(tmp_path / 'a.py').st_mtime_ns
+
+    assert sink.write({'a.py': 'one', 'c.py': 'three'}) == {'written': 1, 'skipped': 1, 'removed': 1}
+    assert os.stat(tmp_path / 'a.py').st_mtime_ns == mtime
+    assert not (tmp_path / 'b.py').exists()
+    assert (tmp_path / 'c.py').read_text() == 'three'
+    assert sorted(os.listdir(tmp_path)) == ['.manifest.json', 'a.py', 'c.py']
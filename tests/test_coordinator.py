@@ -1,8 +1,64 @@
+import sys
+
 from agents.coordinator import CoordinatorAgent
+from agents.frontend_agent import FRONTEND_TEMPLATES, FrontendAgent
+from agents.registry import TemplateRegistry
 
 def test_basic_brief():
     c = CoordinatorAgent()
     out = c.process_brief('Build a task app with auth and tasks')
     assert 'Login.jsx' in out['frontend']
     assert 'Dashboard.jsx' in out['frontend']
-    assert 'auth_routes.py' in out['backend'] or 'Auth' in '\n'.join(out['backend'].keys())
\ No newline at end of file
+    assert 'auth_routes.py' in out['backend'] or 'Auth' in '\n'.join(out['backend'].keys())
+
+def test_keywords_match_whole_words():
+    c = CoordinatorAgent()
+    f_tasks, bk_tasks = c._analyze_brief('Collect feedback from users on stage')
+    assert f_tasks == ['Landing Page']
+    assert 'Database Schema' not in bk_tasks
+    f_tasks, bk_tasks = c._analyze_brief('Authentication, shared todos and a Postgres store')
+    assert f_tasks == ['Login Page', 'Task Dashboard', 'Share Dialog']
+    assert bk_tasks[-1] == 'Database Schema'
+
+
+def test_concurrent_dispatch_matches_sequential():
+    brief = 'Build a task app with auth, sharing and a database'
+    sequential = CoordinatorAgent().process_brief(brief)
+    c = CoordinatorAgent(max_workers=4)
+    out = c.process_brief(brief)
+    assert out == sequential
+    assert list(out['frontend']) == list(sequential['frontend'])
+    assert set(c.last_timings) == {'frontend', 'backend', 'review', 'total'}
+
+
+def test_briefs_with_the_same_task_set_share_cached_output():
+    c = CoordinatorAgent()
+    first = c.process_brief('Task app with login')
+    first['frontend'].clear()
+    again = c.process_brief('Tasks, and an auth page')
+    assert 'Login.jsx' in again['frontend']
+    assert c.cache_stats()['hits'] == 1
+
+
+def test_unmatched_tasks_render_the_fallback_templates():
+    out = CoordinatorAgent().process_brief('A profile page, and something nobody has keywords for')
+    assert 'User_Profile_API.py' in out['backend']
+    assert "user_profile_api_bp = Blueprint('user_profile_api'" in out['backend']['User_Profile_API.py']
+    assert 'ProfilePage.jsx' in out['frontend']
+    assert 'Basic_REST_API.py' in CoordinatorAgent().process_brief('Something vague')['backend']
+
+
+def test_plugins_register_templates_on_first_dispatch(tmp_path, monkeypatch):
+    (tmp_path / 'Profile.jsx.template').write_text('export const {{ name }} = () => null;')
+    (tmp_path / 'profile_plugin.py').write_text(
+        "def register_templates(registry):\n"
+        "    if registry.side == 'frontend':\n"
+        f"        registry.add(('profile',), 'Profile.jsx', 'Profile.jsx.template', {{'name': 'Profile'}}, {str(tmp_path)!r})\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    templates = TemplateRegistry('frontend', fallback=FRONTEND_TEMPLATES.fallback, plugins=['profile_plugin'])
+    assert 'profile_plugin' not in sys.modules
+    agent = FrontendAgent(templates=templates)
+    out = agent.generate_ui_components(['Profile Page', 'Share Dialog'])
+    assert out['Profile.jsx'] == 'export const Profile = () => null;'
+    assert 'ShareDialog.jsx' in out
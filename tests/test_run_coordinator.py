@@ -0,0 +1,13 @@
+import io
+
+from run_coordinator import read_briefs, run_portfolio
+
+
+def test_bad_lines_are_reported_per_brief_and_names_ignore_case(tmp_path):
+    lines = '"login app"\n[1]\n{"title": "Shop", "description": "tasks"}\n{"name": "shop", "brief": "auth"}\nnot json\n'
+    briefs = list(read_briefs(io.StringIO(lines)))
+    assert [name for name, _, _ in briefs] == ['brief-0001', 'brief-0002', 'Shop', 'shop-4', 'brief-0005']
+    assert [error is None for _, _, error in briefs] == [True, False, True, True, False]
+
+    assert run_portfolio(briefs, str(tmp_path), workers=1) == 2
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['Shop', 'brief-0001', 'shop-4']